@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""This is the asyncio queue and deque file"""
+
+#Auther Name: Prathamesh Pawar
+#       Email: prathameshpawar1301@gmail.com
+
+"""AsyncQueue and AsyncDeque wrap Queue and Deque for use from coroutines.
+With maxsize > 0 a full container makes producers wait (backpressure).
+Each blocked coroutine waits on its own future, and the futures are kept
+in a DLL. Waking a waiter pops it from the front in O(1). A cancelled
+waiter unlinks its own node in O(1). If a waiter is woken and then
+cancelled before it runs, it passes the wakeup to the next waiter, so
+no wakeup is lost."""
+
+import asyncio
+
+from Pqueue import Queue
+from Pdeque import Deque
+from Pdll import DLL
+
+class _AsyncContainer:
+
+    def __init__(self, store, maxsize):
+        self._store = store
+        self.maxsize = maxsize
+        self._getters = DLL()
+        self._putters = DLL()
+
+    def __len__(self):
+        return len(self._store)
+
+    def size(self):
+        return len(self._store)
+
+    def isEmpty(self):
+        return len(self._store) == 0
+
+    def isFull(self):
+        return 0 < self.maxsize <= len(self._store)
+
+    def _wakeupNext(self, waiters):
+        while not waiters.isEmpty():
+            waiter = waiters.popFront()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+    async def _wait(self, waiters, ready):
+        waiter = asyncio.get_running_loop().create_future()
+        handle = waiters.addRear(waiter)
+        try:
+            await waiter
+        except BaseException:
+            if waiter.done() and not waiter.cancelled():
+                if ready():
+                    self._wakeupNext(waiters)
+            else:
+                waiter.cancel()
+                # a wakeup may already have popped the cancelled waiter
+                if waiters.isLinked(handle):
+                    waiters.removeNode(handle)
+            raise
+
+    async def _waitNotFull(self):
+        while self.isFull():
+            await self._wait(self._putters, lambda: not self.isFull())
+
+    async def _waitNotEmpty(self):
+        while self.isEmpty():
+            await self._wait(self._getters, lambda: not self.isEmpty())
+
+    def _pushed(self):
+        self._wakeupNext(self._getters)
+
+    def _popped(self):
+        self._wakeupNext(self._putters)
+
+    async def _getMany(self, pop, max_items, timeout):
+        if self.isEmpty():
+            try:
+                await asyncio.wait_for(self._waitNotEmpty(), timeout)
+            except asyncio.TimeoutError:
+                return []
+        batch = []
+        while len(batch) < max_items and not self.isEmpty():
+            batch.append(pop())
+            self._popped()
+        return batch
+
+
+class AsyncQueue(_AsyncContainer):
+
+    def __init__(self, maxsize=0):
+        super().__init__(Queue(), maxsize)
+
+    def __repr__(self):
+        return "AsyncQueue({}, maxsize={})".format(list(self._store), self.maxsize)
+
+    def peek(self):
+        return self._store.peek()
+
+    def put_nowait(self, item):
+        if self.isFull():
+            return False
+        self._store.enqueue(item)
+        self._pushed()
+        return True
+
+    def get_nowait(self):
+        if self.isEmpty():
+            return None
+        item = self._store.dequeue()
+        self._popped()
+        return item
+
+    async def put(self, item):
+        await self._waitNotFull()
+        self.put_nowait(item)
+
+    async def get(self):
+        await self._waitNotEmpty()
+        return self.get_nowait()
+
+    async def get_many(self, max_items, timeout=None):
+        """Wait up to timeout for an item, then return up to max_items of them"""
+        return await self._getMany(self._store.dequeue, max_items, timeout)
+
+
+class AsyncDeque(_AsyncContainer):
+
+    def __init__(self, maxsize=0):
+        super().__init__(Deque(), maxsize)
+
+    def __repr__(self):
+        return "AsyncDeque({}, maxsize={})".format(list(self._store), self.maxsize)
+
+    def peekFront(self):
+        return self._store.peekFront()
+
+    def peekRear(self):
+        return self._store.peekRear()
+
+    async def addFront(self, item):
+        await self._waitNotFull()
+        self._store.addFront(item)
+        self._pushed()
+
+    async def addRear(self, item):
+        await self._waitNotFull()
+        self._store.addRear(item)
+        self._pushed()
+
+    async def removeFront(self):
+        await self._waitNotEmpty()
+        item = self._store.removeFront()
+        self._popped()
+        return item
+
+    async def removeRear(self):
+        await self._waitNotEmpty()
+        item = self._store.removeRear()
+        self._popped()
+        return item
+
+    put = addRear
+    get = removeFront
+
+    async def get_many(self, max_items, timeout=None, front=True):
+        """Wait up to timeout for an item, then return up to max_items from one end"""
+        pop = self._store.removeFront if front else self._store.removeRear
+        return await self._getMany(pop, max_items, timeout)
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""This is the micro-batching queue file"""
+
+#Auther Name: Prathamesh Pawar
+#       Email: prathameshpawar1301@gmail.com
+
+"""BatchQueue collects single items and hands them to consumers in
+batches. Pending items sit in a Queue. A batch is released as soon as
+one of these triggers fires:
+
+- 'size': max_items items are pending
+- 'bytes': the pending items weigh max_bytes, where sizer(item) gives
+  an item's weight (len by default)
+- 'deadline': the oldest pending item has waited max_delay seconds
+
+A batch never holds more than max_items items or (when max_bytes is
+set) more than max_bytes bytes, except that an item heavier than
+max_bytes goes out in a batch of its own.
+
+put() never blocks, so threads and coroutines can both call it.
+Consumers call get_batch() from a thread or await get_batch_async()
+from a coroutine. Both can wait on the same queue at the same time, and
+coroutine waiters are woken with call_soon_threadsafe. close() releases
+what is left as final 'close' batches.
+
+stats() reports how full the batches were, how long their oldest item
+waited (flush latency), and how often each trigger fired."""
+
+import asyncio
+import threading
+import time
+
+from Pdll import DLL
+from Pqueue import Queue
+
+class BatchQueue:
+
+    def __init__(self, max_items=100, max_bytes=None, max_delay=0.05, sizer=len):
+        if max_items < 1:
+            raise ValueError("max_items must be at least 1")
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self.max_delay = max_delay
+        self.sizer = sizer
+        self._items = Queue()
+        self._stamps = Queue()
+        self._sizes = Queue() if max_bytes is not None else None
+        self._bytes = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        self._waiters = DLL()
+
+        self.batches = 0
+        self.released = 0
+        self.triggers = {'size': 0, 'bytes': 0, 'deadline': 0, 'flush': 0, 'close': 0}
+        self._fill = 0.0
+        self._fillBytes = 0.0
+        self._latency = 0.0
+        self._maxLatency = 0.0
+
+    def __len__(self):
+        return len(self._items)
+
+    def __repr__(self):
+        return "BatchQueue(pending={}, max_items={}, max_bytes={}, max_delay={})".format(
+            len(self._items), self.max_items, self.max_bytes, self.max_delay)
+
+    def size(self):
+        return len(self._items)
+
+    def isEmpty(self):
+        return len(self._items) == 0
+
+    def _trigger(self, now):
+        """Name of the trigger that fires now, or None"""
+        if len(self._items) >= self.max_items:
+            return 'size'
+        if self.max_bytes is not None and self._bytes >= self.max_bytes and self._items:
+            return 'bytes'
+        if self._items and now - self._stamps.peek() >= self.max_delay:
+            return 'deadline'
+        if self._closed and self._items:
+            return 'close'
+        return None
+
+    def _deadline(self):
+        if self._items:
+            return self._stamps.peek() + self.max_delay
+        return None
+
+    def _wakeAll(self):
+        self._cond.notify_all()
+        while not self._waiters.isEmpty():
+            loop, waiter = self._waiters.popFront()
+            loop.call_soon_threadsafe(_wakeup, waiter)
+
+    def _put(self, item, now):
+        self._items.enqueue(item)
+        self._stamps.enqueue(now)
+        if self._sizes is not None:
+            weight = self.sizer(item)
+            self._sizes.enqueue(weight)
+            self._bytes += weight
+
+    def put(self, item):
+        self.put_many((item,))
+
+    def put_many(self, items):
+        """Add items under one lock acquisition"""
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("put() on a closed BatchQueue")
+            now = time.monotonic()
+            was_empty = not self._items
+            for item in items:
+                self._put(item, now)
+            # waiters only care about the first item (it sets the deadline) and full batches
+            if (was_empty and self._items) or self._trigger(now) in ('size', 'bytes'):
+                self._wakeAll()
+
+    def _cut(self, trigger, now):
+        count = min(len(self._items), self.max_items)
+        if self._sizes is not None:
+            total = taken = 0
+            for weight in self._sizes:
+                if taken == count or (taken and total + weight > self.max_bytes):
+                    break
+                total += weight
+                taken += 1
+            count = taken
+            self._sizes.dequeue_many(count)
+            self._bytes -= total
+            if self.max_bytes:
+                self._fillBytes += min(1.0, total / self.max_bytes)
+
+        oldest = self._stamps.peek()
+        self._stamps.dequeue_many(count)
+        batch = self._items.dequeue_many(count)
+
+        latency = now - oldest
+        self.batches += 1
+        self.released += count
+        self.triggers[trigger] += 1
+        self._fill += count / self.max_items
+        self._latency += latency
+        self._maxLatency = max(self._maxLatency, latency)
+        if self._items:
+            # more pending work: let another consumer look at it
+            self._wakeAll()
+        return batch
+
+    def _poll(self, deadline):
+        """Return (batch or None, seconds to wait before polling again or None)"""
+        now = time.monotonic()
+        trigger = self._trigger(now)
+        if trigger is not None:
+            return self._cut(trigger, now), None
+        if self._closed:
+            return [], None
+        wait = self._deadline()
+        if deadline is not None:
+            wait = deadline if wait is None else min(wait, deadline)
+        return None, (None if wait is None else max(0.0, wait - now))
+
+    def get_batch(self, timeout=None):
+        """Block until a batch is released; [] on timeout or when closed and drained"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while True:
+                batch, wait = self._poll(deadline)
+                if batch is not None:
+                    return batch
+                if deadline is not None and time.monotonic() >= deadline:
+                    return []
+                self._cond.wait(wait)
+
+    async def get_batch_async(self, timeout=None):
+        """Coroutine form of get_batch; waits without blocking the event loop"""
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._cond:
+                batch, wait = self._poll(deadline)
+                if batch is not None:
+                    return batch
+                if deadline is not None and time.monotonic() >= deadline:
+                    return []
+                waiter = loop.create_future()
+                handle = self._waiters.addRear((loop, waiter))
+            try:
+                await asyncio.wait_for(waiter, wait)
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                with self._cond:
+                    # a wakeup may already have popped this waiter
+                    if self._waiters.isLinked(handle):
+                        self._waiters.removeNode(handle)
+
+    def flush(self):
+        """Release the pending items now (one batch, within the size limits), without waiting"""
+        with self._cond:
+            if not self._items:
+                return []
+            return self._cut('flush', time.monotonic())
+
+    def close(self):
+        """Refuse further puts; consumers drain the rest as 'close' batches, then get []"""
+        with self._cond:
+            self._closed = True
+            self._wakeAll()
+
+    def stats(self):
+        with self._cond:
+            batches = self.batches or 1
+            stats = {
+                'batches': self.batches,
+                'items': self.released,
+                'pending': len(self._items),
+                'fill_ratio': self._fill / batches,
+                'mean_latency': self._latency / batches,
+                'max_latency': self._maxLatency,
+                'triggers': dict(self.triggers),
+            }
+            if self.max_bytes:
+                stats['byte_fill_ratio'] = self._fillBytes / batches
+            return stats
+
+
+def _wakeup(waiter):
+    if not waiter.done():
+        waiter.set_result(None)
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""This is the thread-safe blocking queue file"""
+
+#Auther Name: Prathamesh Pawar
+#       Email: prathameshpawar1301@gmail.com
+
+"""BlockingQueue is a Queue that can be shared between threads. One lock
+guards the ring buffer and two conditions on it wake blocked producers
+and consumers. maxsize bounds the queue (0 means unbounded).
+
+put/get block up to `timeout` seconds (None waits forever) and report a
+timeout by returning False/None. put_many/get_many move a whole batch per
+lock acquisition. task_done/join follow the standard library queue.
+The Queue methods enqueue/dequeue and enqueue_many/dequeue_many are
+non-blocking put/get calls, so they also respect the lock and maxsize."""
+
+import threading
+import time
+
+from Pqueue import Queue
+
+class BlockingQueue(Queue):
+
+    def __init__(self, maxsize=0):
+        super().__init__()
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        self._all_done = threading.Condition(self._lock)
+        self._unfinished = 0
+
+    def _room(self):
+        if self.maxsize <= 0:
+            return float('inf')
+        return max(0, self.maxsize - self._count)
+
+    def _put(self, item):
+        Queue.enqueue(self, item)
+        self._unfinished += 1
+
+    def put(self, item, timeout=None):
+        with self._not_full:
+            if not self._not_full.wait_for(self._room, timeout):
+                return False
+            self._put(item)
+            self._not_empty.notify()
+            return True
+
+    def get(self, timeout=None):
+        with self._not_empty:
+            if not self._not_empty.wait_for(self.size, timeout):
+                return None
+            item = Queue.dequeue(self)
+            self._not_full.notify()
+            return item
+
+    def put_many(self, items, timeout=None):
+        """Put items in batches, one lock acquisition per batch; return how many were put"""
+        items = list(items)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        done = 0
+        with self._not_full:
+            while done < len(items):
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if not self._not_full.wait_for(self._room, remaining):
+                    break
+                room = min(self._room(), len(items) - done)
+                Queue.enqueue_many(self, items[done:done + room])
+                self._unfinished += room
+                done += room
+                self._not_empty.notify(room)
+        return done
+
+    def get_many(self, max_items, timeout=None):
+        """Wait for at least one item, then take up to max_items under one lock acquisition"""
+        with self._not_empty:
+            if not self._not_empty.wait_for(self.size, timeout):
+                return []
+            batch = Queue.dequeue_many(self, max_items)
+            self._not_full.notify(len(batch))
+            return batch
+
+    def task_done(self):
+        with self._all_done:
+            if self._unfinished <= 0:
+                raise ValueError("task_done() called too many times")
+            self._unfinished -= 1
+            if self._unfinished == 0:
+                self._all_done.notify_all()
+
+    def join(self, timeout=None):
+        """Block until every item put has been marked done; False on timeout"""
+        with self._all_done:
+            return self._all_done.wait_for(lambda: self._unfinished == 0, timeout)
+
+    def enqueue(self, item):
+        return self.put(item, timeout=0)
+
+    def dequeue(self):
+        return self.get(timeout=0)
+
+    def enqueue_many(self, iterable):
+        return self.put_many(iterable, timeout=0)
+
+    def dequeue_many(self, n):
+        return self.get_many(n, timeout=0)
+
+    def peek(self):
+        with self._lock:
+            return Queue.peek(self)
+
+    def isFull(self):
+        with self._lock:
+            return self.maxsize > 0 and self._count >= self.maxsize
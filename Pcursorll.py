@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+
+"""filename: Pcursorll.py for array backed (cursor) doubly linked list"""
+#Author name: Prathamesh Pawar
+#       email: prathameshpawar1301@gmail.com
+
+##################################################################################################################
+# supporting meathods
+##  isEmpty
+##  size
+##  search
+##  addFront
+##  addRear
+##  popFront
+##  popRear
+##  remove
+##  removeNode
+##################################################################################################################
+"""CursorLL stores the list in parallel preallocated arrays instead of Node
+objects: data[i], next[i] and prev[i] describe slot i and links are slot
+numbers (NIL marks the end). Freed slots are chained through next[] into a
+free-list and reused, so inserts and removes allocate no objects at all.
+Passing a typecode ('i', 'q', 'd', ...) packs the values into a typed
+array.array; otherwise any Python object can be stored.
+
+addFront/addRear return the slot number, which works as a node handle for
+removeNode just like the nodes returned by DLL."""
+
+from array import array
+
+NIL = -1
+
+
+class CursorLL:
+
+    def __init__(self, capacity=16, typecode=None):
+        capacity = max(1, capacity)
+        self.typecode = typecode
+        self._blank = None if typecode is None else array(typecode, [0])[0]
+        if typecode is None:
+            self._data = [None] * capacity
+        else:
+            self._data = array(typecode, [self._blank]) * capacity
+        self._next = array('q', range(1, capacity + 1))
+        self._next[capacity - 1] = NIL
+        self._prev = array('q', [NIL]) * capacity
+        self._free = 0
+        self.head = NIL
+        self.tail = NIL
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        data, nxt = self._data, self._next
+        slot = self.head
+        while slot != NIL:
+            yield data[slot]
+            slot = nxt[slot]
+
+    def __reversed__(self):
+        data, prev = self._data, self._prev
+        slot = self.tail
+        while slot != NIL:
+            yield data[slot]
+            slot = prev[slot]
+
+    def __repr__(self):
+        return "CursorLL({})".format(list(self))
+
+    def capacity(self):
+        return len(self._next)
+
+    def _grow(self):
+        old = len(self._next)
+        new = old * 2
+        if self.typecode is None:
+            self._data.extend([None] * old)
+        else:
+            self._data.extend(array(self.typecode, [self._blank]) * old)
+        self._next.extend(range(old + 1, new + 1))
+        self._next[new - 1] = NIL
+        self._prev.extend(array('q', [NIL]) * old)
+        self._free = old
+
+    def _alloc(self, new_data):
+        if self._free == NIL:
+            self._grow()
+        slot = self._free
+        self._free = self._next[slot]
+        self._data[slot] = new_data
+        return slot
+
+    def _release(self, slot):
+        self._data[slot] = self._blank
+        self._prev[slot] = NIL
+        self._next[slot] = self._free
+        self._free = slot
+
+    def isEmpty(self):
+        return self._size == 0
+
+    def size(self):
+        return self._size
+
+    def search(self, data):
+        if self.head == NIL:
+            return "Empty List. No Nodes exist to search from."
+
+        for value in self:
+            if value == data:
+                return True
+        return False
+
+    def addFront(self, new_data):
+        slot = self._alloc(new_data)
+        self._prev[slot] = NIL
+        self._next[slot] = self.head
+        if self.head == NIL:
+            self.tail = slot
+        else:
+            self._prev[self.head] = slot
+        self.head = slot
+        self._size += 1
+        return slot
+
+    def addRear(self, new_data):
+        slot = self._alloc(new_data)
+        self._next[slot] = NIL
+        self._prev[slot] = self.tail
+        if self.tail == NIL:
+            self.head = slot
+        else:
+            self._next[self.tail] = slot
+        self.tail = slot
+        self._size += 1
+        return slot
+
+    def removeNode(self, slot):
+        """Unlink the slot returned by addFront/addRear and return its data"""
+        prev, nxt = self._prev[slot], self._next[slot]
+        if prev == NIL:
+            self.head = nxt
+        else:
+            self._next[prev] = nxt
+        if nxt == NIL:
+            self.tail = prev
+        else:
+            self._prev[nxt] = prev
+
+        value = self._data[slot]
+        self._release(slot)
+        self._size -= 1
+        return value
+
+    def popFront(self):
+        if self.head == NIL:
+            return None
+        return self.removeNode(self.head)
+
+    def popRear(self):
+        if self.tail == NIL:
+            return None
+        return self.removeNode(self.tail)
+
+    def remove(self, data):
+        if self.head == NIL:
+            return "Empty list: No nodes to remove"
+
+        data_arr, nxt = self._data, self._next
+        slot = self.head
+        while slot != NIL:
+            if data_arr[slot] == data:
+                self.removeNode(slot)
+                return
+            slot = nxt[slot]
+        return "No node contains provided data. No node is removed"
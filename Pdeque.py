@@ -4,41 +4,424 @@
 #Auther Name: Prathamesh Pawar
 #       Email: prathameshpawar1301@gmail.com
 
+"""Deque is stored as a doubly linked chain of fixed-size blocks. Both ends
+are O(1) because only the end blocks are touched, indexed access walks at
+most n/BLOCK_SIZE blocks, and one block object is allocated per
+BLOCK_SIZE items instead of one Node per item.
+
+Passing maxlen gives a BoundedDeque instead: a ring buffer preallocated
+once, with an overflow policy of 'evict' (drop from the opposite end),
+'reject' (the add returns False) or 'block' (wait for room)."""
+
+import threading
+from contextlib import nullcontext
+
+BLOCK_SIZE = 64
+CENTER = BLOCK_SIZE // 2
+MAX_FREE_BLOCKS = 16
+OVERFLOW_POLICIES = ('evict', 'reject', 'block')
 
-class Deque:
+
+class _Block:
+
+    __slots__ = ('items', 'prev', 'next')
 
     def __init__(self):
+        self.items = [None] * BLOCK_SIZE
+        self.prev = None
+        self.next = None
+
+
+class Deque:
+
+    maxlen = None
+
+    def __new__(cls, maxlen=None, overflow='evict'):
+        if cls is Deque and maxlen is not None:
+            cls = BoundedDeque
+        return object.__new__(cls)
+
+    def __init__(self, maxlen=None, overflow='evict'):
+        block = _Block()
+        self._leftblock = block
+        self._rightblock = block
+        self._leftindex = CENTER
+        self._rightindex = CENTER - 1
+        self._len = 0
+        self._free = []
+
+    def _newblock(self):
+        if self._free:
+            return self._free.pop()
+        return _Block()
+
+    def _freeblock(self, block):
+        if len(self._free) < MAX_FREE_BLOCKS:
+            block.prev = block.next = None
+            self._free.append(block)
+
+    def __len__(self):
+        return self._len
 
-        self.items = []
+    def __iter__(self):
+        block = self._leftblock
+        index = self._leftindex
+        for _ in range(self._len):
+            if index == BLOCK_SIZE:
+                block = block.next
+                index = 0
+            yield block.items[index]
+            index += 1
+
+    def __reversed__(self):
+        block = self._rightblock
+        index = self._rightindex
+        for _ in range(self._len):
+            if index < 0:
+                block = block.prev
+                index = BLOCK_SIZE - 1
+            yield block.items[index]
+            index -= 1
+
+    def __repr__(self):
+        return "Deque({})".format(list(self))
+
+    @property
+    def items(self):
+        """Snapshot of the deque as a list, front first"""
+        return list(self)
+
+    def _locate(self, index):
+        """Return (block, offset) holding position `index`, walking from the nearer end"""
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("deque index out of range")
+
+        if index < self._len >> 1:
+            block = self._leftblock
+            offset = self._leftindex + index
+            while offset >= BLOCK_SIZE:
+                block = block.next
+                offset -= BLOCK_SIZE
+        else:
+            block = self._rightblock
+            offset = self._rightindex - (self._len - 1 - index)
+            while offset < 0:
+                block = block.prev
+                offset += BLOCK_SIZE
+        return block, offset
+
+    def __getitem__(self, index):
+        block, offset = self._locate(index)
+        return block.items[offset]
+
+    def __setitem__(self, index, item):
+        block, offset = self._locate(index)
+        block.items[offset] = item
 
     def addFront(self, item):
-        self.items.insert(0, item)
+        if self._leftindex == 0:
+            block = self._newblock()
+            block.next = self._leftblock
+            self._leftblock.prev = block
+            self._leftblock = block
+            self._leftindex = BLOCK_SIZE
+        self._leftindex -= 1
+        self._leftblock.items[self._leftindex] = item
+        self._len += 1
 
     def addRear(self, item):
-        self.items.append(item)
+        if self._rightindex == BLOCK_SIZE - 1:
+            block = self._newblock()
+            block.prev = self._rightblock
+            self._rightblock.next = block
+            self._rightblock = block
+            self._rightindex = -1
+        self._rightindex += 1
+        self._rightblock.items[self._rightindex] = item
+        self._len += 1
 
     def removeRear(self):
-        if self.items:
-            return self.items.pop()
-        return None
+        if not self._len:
+            return None
+        block = self._rightblock
+        item = block.items[self._rightindex]
+        block.items[self._rightindex] = None
+        self._rightindex -= 1
+        self._len -= 1
+
+        if not self._len:
+            self._leftindex = CENTER
+            self._rightindex = CENTER - 1
+        elif self._rightindex < 0:
+            self._rightblock = block.prev
+            self._rightblock.next = None
+            self._rightindex = BLOCK_SIZE - 1
+            self._freeblock(block)
+        return item
 
     def removeFront(self):
-        if self.items:
-            return self.items.pop(0)
-        return None
+        if not self._len:
+            return None
+        block = self._leftblock
+        item = block.items[self._leftindex]
+        block.items[self._leftindex] = None
+        self._leftindex += 1
+        self._len -= 1
+
+        if not self._len:
+            self._leftindex = CENTER
+            self._rightindex = CENTER - 1
+        elif self._leftindex == BLOCK_SIZE:
+            self._leftblock = block.next
+            self._leftblock.prev = None
+            self._leftindex = 0
+            self._freeblock(block)
+        return item
+
+    def extend_rear(self, iterable):
+        """addRear every item of iterable, copying whole block slices at a time"""
+        items = list(iterable)
+        pos, total = 0, len(items)
+        while pos < total:
+            if self._rightindex == BLOCK_SIZE - 1:
+                block = self._newblock()
+                block.prev = self._rightblock
+                self._rightblock.next = block
+                self._rightblock = block
+                self._rightindex = -1
+            start = self._rightindex + 1
+            take = min(BLOCK_SIZE - start, total - pos)
+            self._rightblock.items[start:start + take] = items[pos:pos + take]
+            self._rightindex += take
+            pos += take
+        self._len += total
+
+    def extend_front(self, iterable):
+        """addFront every item of iterable in turn, so they end up in reverse order"""
+        items = list(iterable)
+        pos, total = 0, len(items)
+        while pos < total:
+            if self._leftindex == 0:
+                block = self._newblock()
+                block.next = self._leftblock
+                self._leftblock.prev = block
+                self._leftblock = block
+                self._leftindex = BLOCK_SIZE
+            take = min(self._leftindex, total - pos)
+            end = self._leftindex
+            self._leftblock.items[end - take:end] = items[pos:pos + take][::-1]
+            self._leftindex -= take
+            pos += take
+        self._len += total
+
+    def drain(self, n=None):
+        """Remove up to n items (all when n is None) from the front and return them as a list"""
+        n = self._len if n is None else max(0, min(n, self._len))
+        batch = []
+        while len(batch) < n:
+            block = self._leftblock
+            start = self._leftindex
+            end = self._rightindex + 1 if block is self._rightblock else BLOCK_SIZE
+            take = min(end - start, n - len(batch))
+            batch.extend(block.items[start:start + take])
+            block.items[start:start + take] = [None] * take
+            self._leftindex += take
+            self._len -= take
+
+            if not self._len:
+                self._leftindex = CENTER
+                self._rightindex = CENTER - 1
+            elif self._leftindex == BLOCK_SIZE:
+                self._leftblock = block.next
+                self._leftblock.prev = None
+                self._leftindex = 0
+                self._freeblock(block)
+        return batch
+
+    def rotate(self, n=1):
+        """Rotate n steps to the right (to the left when n is negative)"""
+        if self._len < 2:
+            return
+        n %= self._len
+        if n > self._len >> 1:
+            for _ in range(self._len - n):
+                self.addRear(self.removeFront())
+        else:
+            for _ in range(n):
+                self.addFront(self.removeRear())
 
     def peekFront(self):
-        if self.items:
-            return self.items[0]
+        if self._len:
+            return self._leftblock.items[self._leftindex]
         return None
 
     def peekRear(self):
-        if self.items:
-            return self.items[-1]
+        if self._len:
+            return self._rightblock.items[self._rightindex]
         return None
 
     def size(self):
-        return len(self.items)
+        return self._len
 
     def isEmpty(self):
-        return self.items == []
+        return self._len == 0
+
+
+class BoundedDeque(Deque):
+
+    def __init__(self, maxlen, overflow='evict'):
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError("overflow must be one of {}".format(OVERFLOW_POLICIES))
+        self.maxlen = max(0, maxlen)
+        self.overflow = overflow
+        self._buf = [None] * self.maxlen
+        self._head = 0
+        self._len = 0
+        self._blocking = overflow == 'block'
+        self._lock = threading.Condition() if self._blocking else nullcontext()
+
+    def __iter__(self):
+        buf, cap, head = self._buf, self.maxlen, self._head
+        for i in range(self._len):
+            index = head + i
+            yield buf[index - cap if index >= cap else index]
+
+    def __reversed__(self):
+        buf, cap, head = self._buf, self.maxlen, self._head
+        for i in range(self._len - 1, -1, -1):
+            index = head + i
+            yield buf[index - cap if index >= cap else index]
+
+    def __repr__(self):
+        return "Deque({}, maxlen={})".format(list(self), self.maxlen)
+
+    def _slot(self, index):
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("deque index out of range")
+        index += self._head
+        return index - self.maxlen if index >= self.maxlen else index
+
+    def __getitem__(self, index):
+        return self._buf[self._slot(index)]
+
+    def __setitem__(self, index, item):
+        self._buf[self._slot(index)] = item
+
+    def isFull(self):
+        return self._len == self.maxlen
+
+    def _hasRoom(self):
+        return self._len < self.maxlen
+
+    def _push(self, item, front, timeout):
+        with self._lock:
+            if self._len == self.maxlen:
+                if self._blocking:
+                    if not self._lock.wait_for(self._hasRoom, timeout):
+                        return False
+                elif self.overflow == 'reject' or not self.maxlen:
+                    return self.overflow == 'evict'
+                else:
+                    self._len -= 1
+                    if not front:
+                        self._head = self._head + 1 if self._head + 1 < self.maxlen else 0
+
+            if front:
+                self._head = (self._head or self.maxlen) - 1
+                self._buf[self._head] = item
+            else:
+                index = self._head + self._len
+                self._buf[index - self.maxlen if index >= self.maxlen else index] = item
+            self._len += 1
+            return True
+
+    def addFront(self, item, timeout=None):
+        """Add at the front; on overflow 'evict' drops the rear item"""
+        return self._push(item, True, timeout)
+
+    def addRear(self, item, timeout=None):
+        """Add at the rear; on overflow 'evict' drops the front item"""
+        return self._push(item, False, timeout)
+
+    def removeRear(self):
+        with self._lock:
+            if not self._len:
+                return None
+            self._len -= 1
+            index = self._head + self._len
+            if index >= self.maxlen:
+                index -= self.maxlen
+            item = self._buf[index]
+            self._buf[index] = None
+            if self._blocking:
+                self._lock.notify()
+            return item
+
+    def removeFront(self):
+        with self._lock:
+            if not self._len:
+                return None
+            item = self._buf[self._head]
+            self._buf[self._head] = None
+            self._head = self._head + 1 if self._head + 1 < self.maxlen else 0
+            self._len -= 1
+            if self._blocking:
+                self._lock.notify()
+            return item
+
+    def extend_rear(self, iterable):
+        for item in iterable:
+            self.addRear(item)
+
+    def extend_front(self, iterable):
+        for item in iterable:
+            self.addFront(item)
+
+    def drain(self, n=None):
+        """Remove up to n items (all when n is None) from the front and return them as a list"""
+        with self._lock:
+            n = self._len if n is None else max(0, min(n, self._len))
+            first = min(n, self.maxlen - self._head)
+            batch = self._buf[self._head:self._head + first] + self._buf[:n - first]
+            self._buf[self._head:self._head + first] = [None] * first
+            self._buf[:n - first] = [None] * (n - first)
+            self._head = (self._head + n) % self.maxlen if self.maxlen else 0
+            self._len -= n
+            if self._blocking:
+                self._lock.notify(n)
+            return batch
+
+    def rotate(self, n=1):
+        """Rotate n steps to the right; O(1) when the ring is full"""
+        with self._lock:
+            if self._len < 2:
+                return
+            if self._len == self.maxlen:
+                self._head = (self._head - n) % self.maxlen
+                return
+            n %= self._len
+            buf, cap = self._buf, self.maxlen
+            if n > self._len >> 1:
+                for _ in range(self._len - n):
+                    tail = (self._head + self._len) % cap
+                    buf[tail], buf[self._head] = buf[self._head], None
+                    self._head = (self._head + 1) % cap
+            else:
+                for _ in range(n):
+                    tail = (self._head + self._len - 1) % cap
+                    self._head = (self._head - 1) % cap
+                    buf[self._head], buf[tail] = buf[tail], None
+
+    def peekFront(self):
+        if self._len:
+            return self._buf[self._head]
+        return None
+
+    def peekRear(self):
+        if self._len:
+            return self[-1]
+        return None
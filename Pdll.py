@@ -10,39 +10,89 @@
 ##  size
 ##  search
 ##  addFront
+##  addRear
+##  addAfter
+##  popFront
+##  popRear
 ##  remove
+##  removeNode
+##  isLinked
+##  moveToFront
+##  splice
+##  sort
+##  merge
+##  dedupe
+##  reverse
 ##################################################################################################################
-"""Importing Node class from Pnode file"""
+"""addFront/addRear/addAfter return the inserted DNode as a handle.
+removeNode and moveToFront take such a handle and relink it in O(1); the
+handle must belong to this list, which is not checked. isLinked tells
+whether such a handle is still in the list.
+
+DLL(indexed=True) keeps a NodeIndex from value to node so search and
+remove by value are O(1) on average. splice then indexes the spliced
+nodes, which is O(m) in the length of the other list.
+
+DLL(pool=NodePool(DNode)) draws new nodes from the pool and returns
+removed nodes to it; handles of removed nodes must not be reused.
+
+sort, merge, dedupe and reverse relink the existing nodes in place (see
+Plinkops.py), so handles stay valid except for nodes dedupe removes."""
+
+"""Importing DNode class from Pnode file"""
 from Pnode import *
+from Pindex import NodeIndex
+from Plinkops import linkPrev, mergeChains, sortChain
 
 class DLL:
 
-    def __init__(self):
+    def __init__(self, indexed=False, pool=None):
         self.head = None
+        self.tail = None
+        self._size = 0
+        self._index = NodeIndex() if indexed else None
+        self._pool = pool
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        current = self.head
+        while current is not None:
+            yield current.data
+            current = current.next
+
+    def __reversed__(self):
+        current = self.tail
+        while current is not None:
+            yield current.data
+            current = current.prev
 
     def __repr__(self):
         return "The node data is: data = {}".format(self.data)
 
+    def _newNode(self, new_data):
+        if self._pool is None:
+            return DNode(new_data)
+        return self._pool.acquire(new_data)
+
+    def _freeNode(self, node):
+        if self._pool is not None:
+            self._pool.release(node)
+
     def isEmpty(self):
         return self.head is None
 
     def size(self):
-        size = 0
-
-        if self.head is None:
-            return 0
-        
-        current = self.head
-        while current is not None:
-            size += 1
-            current =  current.getNext()
-
-        return size
+        return self._size
 
     def search(self, data):
         if self.head is None:
             return "Empty List. No Nodes exist to search from."
 
+        if self._index is not None:
+            return data in self._index
+
         current =  self.head
         while current is not None:
             if current.getData() == data:
@@ -54,19 +104,149 @@ class DLL:
 
     def addFront(self, new_data):
 
-        temp = Node(new_data)
+        temp = self._newNode(new_data)
         temp.setNext(self.head)
 
         if self.head is not  None:
             self.head.setPrev(temp)
+        else:
+            self.tail = temp
 
         self.head = temp
+        self._size += 1
+        if self._index is not None:
+            self._index.add(temp, front=True)
+        return temp
+
+    def addRear(self, new_data):
+
+        temp = self._newNode(new_data)
+        temp.setPrev(self.tail)
+
+        if self.tail is not None:
+            self.tail.setNext(temp)
+        else:
+            self.head = temp
+
+        self.tail = temp
+        self._size += 1
+        if self._index is not None:
+            self._index.add(temp)
+        return temp
+
+    def addAfter(self, node, new_data):
+        """Insert new_data right after the node handle `node` in O(1). When indexed
+        and new_data repeats, walks back to its previous occurrence so the index
+        stays in list order"""
+        if node is self.tail:
+            return self.addRear(new_data)
+
+        temp = self._newNode(new_data)
+        temp.setPrev(node)
+        temp.setNext(node.getNext())
+        node.getNext().setPrev(temp)
+        node.setNext(temp)
+        self._size += 1
+        if self._index is not None:
+            if new_data in self._index:
+                previous = node
+                while previous is not None and previous.data != new_data:
+                    previous = previous.getPrev()
+                self._index.addAfter(temp, previous)
+            else:
+                self._index.add(temp)
+        return temp
+
+    def _unlink(self, node):
+        if self._index is not None:
+            self._index.discard(node)
+
+        if node.prev is None:
+            self.head = node.next
+        else:
+            node.prev.next = node.next
+
+        if node.next is None:
+            self.tail = node.prev
+        else:
+            node.next.prev = node.prev
+
+        node.prev = node.next = None
+        self._size -= 1
+
+    def popFront(self):
+        if self.head is None:
+            return None
+
+        temp = self.head
+        return self.removeNode(temp)
+
+    def popRear(self):
+        if self.tail is None:
+            return None
+
+        temp = self.tail
+        return self.removeNode(temp)
+
+    def removeNode(self, node):
+        """Unlink a node handle returned by addFront/addRear and return its data"""
+        self._unlink(node)
+        data = node.getData()
+        self._freeNode(node)
+        return data
+
+    def isLinked(self, node):
+        """True while the node handle is still in this list; unlinking clears its prev"""
+        return node is self.head or node.prev is not None
+
+    def moveToFront(self, node):
+        if node is self.head:
+            return
+        self._unlink(node)
+        node.next = self.head
+        if self.head is not None:
+            self.head.prev = node
+        else:
+            self.tail = node
+        self.head = node
+        self._size += 1
+        if self._index is not None:
+            self._index.add(node, front=True)
+
+    def splice(self, other):
+        """Append all nodes of `other` to the rear in O(1), leaving `other` empty"""
+        if other is self or other.head is None:
+            return
+        if self._index is not None:
+            current = other.head
+            while current is not None:
+                self._index.add(current)
+                current = current.next
+        if other._index is not None:
+            other._index.clear()
+        if self.tail is None:
+            self.head = other.head
+        else:
+            self.tail.next = other.head
+            other.head.prev = self.tail
+        self.tail = other.tail
+        self._size += other._size
+
+        other.head = other.tail = None
+        other._size = 0
 
     def remove(self, data):
 
         if self.head is None:
             return "Empty list: No nodes to remove"
 
+        if self._index is not None:
+            current = self._index.first(data)
+            if current is None:
+                return "No node contains provided data. No node is removed"
+            self.removeNode(current)
+            return
+
         current = self.head
         found = False
 
@@ -79,8 +259,59 @@ class DLL:
                 else:
                     current = current.getNext()
 
-        if current.getPrev() is None:
-            self.head = current.getNext()
-        else:
-            current.prev.setNext(current.getNext())
-            current.next.setPrev(current.getPrev())
+        self.removeNode(current)
+
+    def _reindex(self):
+        """Rebuild the value index after nodes were reordered"""
+        if self._index is None:
+            return
+        self._index.clear()
+        current = self.head
+        while current is not None:
+            self._index.add(current)
+            current = current.next
+
+    def sort(self, key=None):
+        """Stable in-place bottom-up merge sort, O(n log n), by relinking nodes"""
+        self.head, self.tail = sortChain(self.head, self._size, key)
+        linkPrev(self.head)
+        self._reindex()
+
+    def merge(self, other, key=None):
+        """Merge the sorted list `other` into this sorted list in O(n + m), leaving `other` empty"""
+        if other is self or other.head is None:
+            return
+        self.head, self.tail = mergeChains(self.head, other.head, key)
+        linkPrev(self.head)
+        self._size += other._size
+        other.head = other.tail = None
+        other._size = 0
+        if other._index is not None:
+            other._index.clear()
+        self._reindex()
+
+    def dedupe(self, key=None):
+        """Remove nodes equal to their predecessor, keeping the first of each run; return the count removed"""
+        removed = 0
+        current = self.head
+        while current is not None and current.next is not None:
+            following = current.next
+            if key is None:
+                same = following.data == current.data
+            else:
+                same = key(following.data) == key(current.data)
+            if same:
+                self.removeNode(following)
+                removed += 1
+            else:
+                current = following
+        return removed
+
+    def reverse(self):
+        """Reverse the list in place in O(n) by swapping each node's links"""
+        current = self.head
+        while current is not None:
+            current.next, current.prev = current.prev, current.next
+            current = current.prev
+        self.head, self.tail = self.tail, self.head
+        self._reindex()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""Filename: Pindex.py for the value index of linked lists"""
+
+#Author Name: Prathamesh Pawar
+#       Email: prathameshpawar1301@gmail.com
+
+"""NodeIndex maps a value to the node that holds it, or to a list of nodes
+(in list order) when the value repeats. SLL and DLL keep one when created
+with indexed=True so search and remove by value are O(1) on average.
+Values must be hashable in that mode."""
+
+class NodeIndex:
+
+    def __init__(self):
+        self._map = {}
+
+    def __contains__(self, value):
+        return value in self._map
+
+    def __len__(self):
+        return len(self._map)
+
+    def add(self, node, front=False):
+        entry = self._map.get(node.data)
+        if entry is None:
+            self._map[node.data] = node
+        elif type(entry) is list:
+            if front:
+                entry.insert(0, node)
+            else:
+                entry.append(node)
+        else:
+            self._map[node.data] = [node, entry] if front else [entry, node]
+
+    def addAfter(self, node, previous):
+        """Add node right after previous, the nearest earlier node with the same
+        value in list order; previous=None makes node the first one"""
+        if previous is None:
+            self.add(node, front=True)
+            return
+        entry = self._map[node.data]
+        if entry is previous:
+            self._map[node.data] = [previous, node]
+        else:
+            entry.insert(entry.index(previous) + 1, node)
+
+    def first(self, value):
+        """Return the first node holding value, or None"""
+        entry = self._map.get(value)
+        if type(entry) is list:
+            return entry[0]
+        return entry
+
+    def discard(self, node):
+        entry = self._map.get(node.data)
+        if entry is node:
+            del self._map[node.data]
+        elif type(entry) is list:
+            entry.remove(node)
+            if len(entry) == 1:
+                self._map[node.data] = entry[0]
+
+    def replace(self, old, new):
+        """Point the entry for old.data at new instead of old"""
+        entry = self._map[old.data]
+        if entry is old:
+            self._map[old.data] = new
+        else:
+            entry[entry.index(old)] = new
+
+    def clear(self):
+        self._map.clear()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""This is the LFU cache file"""
+
+#Auther Name: Prathamesh Pawar
+#       Email: prathameshpawar1301@gmail.com
+
+"""LFUCache evicts the least frequently used key in O(1). It keeps a DLL
+of frequency buckets in ascending order of use count. Each bucket holds
+a DLL of the keys with that count, most recently used first. A dict maps
+each key to its node in the bucket's key list.
+
+An access moves the key into the bucket for count + 1, which is the next
+bucket or a new one inserted after the current bucket with DLL.addAfter.
+A bucket is unlinked when it becomes empty. Eviction takes the tail of
+the first bucket: the least recently used of the least frequently used
+keys."""
+
+from Pdll import DLL
+
+class _Bucket:
+
+    __slots__ = ('count', 'keys')
+
+    def __init__(self, count):
+        self.count = count
+        self.keys = DLL()
+
+
+class _Entry:
+
+    __slots__ = ('key', 'value', 'bucket')
+
+    def __init__(self, key, value, bucket):
+        self.key = key
+        self.value = value
+        self.bucket = bucket
+
+
+class LFUCache:
+
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self._map = {}
+        self._buckets = DLL()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._map)
+
+    def __contains__(self, key):
+        return key in self._map
+
+    def __repr__(self):
+        return "LFUCache(size={}, maxsize={}, hits={}, misses={})".format(
+            len(self._map), self.maxsize, self.hits, self.misses)
+
+    def _touch(self, node):
+        """Move an entry's node from its bucket to the bucket for count + 1"""
+        entry = node.data
+        bucket_node = entry.bucket
+        count = bucket_node.data.count + 1
+
+        following = bucket_node.next
+        if following is None or following.data.count != count:
+            following = self._buckets.addAfter(bucket_node, _Bucket(count))
+
+        bucket_node.data.keys.removeNode(node)
+        if bucket_node.data.keys.isEmpty():
+            self._buckets.removeNode(bucket_node)
+
+        entry.bucket = following
+        self._map[entry.key] = following.data.keys.addFront(entry)
+
+    def _evict(self):
+        bucket_node = self._buckets.head
+        entry = bucket_node.data.keys.popRear()
+        if bucket_node.data.keys.isEmpty():
+            self._buckets.removeNode(bucket_node)
+        del self._map[entry.key]
+        self.evictions += 1
+
+    def get(self, key, default=None):
+        node = self._map.get(key)
+        if node is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._touch(node)
+        return node.data.value
+
+    def put(self, key, value):
+        node = self._map.get(key)
+        if node is not None:
+            node.data.value = value
+            self._touch(node)
+            return
+        if self.maxsize <= 0:
+            return
+        if len(self._map) >= self.maxsize:
+            self._evict()
+
+        first = self._buckets.head
+        if first is None or first.data.count != 1:
+            first = self._buckets.addFront(_Bucket(1))
+        self._map[key] = first.data.keys.addFront(_Entry(key, value, first))
+
+    def remove(self, key):
+        node = self._map.pop(key, None)
+        if node is None:
+            return False
+        bucket_node = node.data.bucket
+        bucket_node.data.keys.removeNode(node)
+        if bucket_node.data.keys.isEmpty():
+            self._buckets.removeNode(bucket_node)
+        return True
+
+    def frequency(self, key):
+        """Use count of key (1 after insertion), or 0 when absent"""
+        node = self._map.get(key)
+        return 0 if node is None else node.data.bucket.data.count
+
+    def clear(self):
+        self._map.clear()
+        self._buckets = DLL()
+
+    def stats(self):
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'size': len(self._map),
+            'buckets': len(self._buckets),
+        }
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""Filename: Plinkops.py for ordering operations on linked node chains"""
+
+#Author Name: Prathamesh Pawar
+#       Email: prathameshpawar1301@gmail.com
+
+"""Helpers shared by SLL and DLL for sort, merge, dedupe and reverse. They
+work on a chain of nodes linked through `next` and ending in None, and
+they only relink existing nodes; no node is ever allocated. DLL repairs
+its prev pointers afterwards with one pass of linkPrev.
+
+sortChain is a bottom-up merge sort: it merges runs of width 1, 2, 4, ...
+across the chain, so it needs no recursion and no extra memory beyond a
+few local pointers. Like list.sort it is stable. When key is given it is
+called on each comparison instead of being cached, so memory stays flat."""
+
+def cutChain(node, count):
+    """Detach the chain after `count` nodes starting at node; return the rest"""
+    for _ in range(count - 1):
+        if node is None:
+            return None
+        node = node.next
+    if node is None:
+        return None
+    rest = node.next
+    node.next = None
+    return rest
+
+
+def mergeChains(a, b, key=None):
+    """Merge two sorted chains; return (head, tail). Ties keep the node from a first"""
+    head = tail = None
+    while a is not None and b is not None:
+        if key is None:
+            take_b = b.data < a.data
+        else:
+            take_b = key(b.data) < key(a.data)
+        if take_b:
+            node, b = b, b.next
+        else:
+            node, a = a, a.next
+        if tail is None:
+            head = node
+        else:
+            tail.next = node
+        tail = node
+
+    rest = a if a is not None else b
+    if tail is None:
+        head = rest
+    else:
+        tail.next = rest
+    if rest is not None:
+        tail = rest
+        while tail.next is not None:
+            tail = tail.next
+    return head, tail
+
+
+def sortChain(head, length, key=None):
+    """Stable bottom-up merge sort of a chain of `length` nodes; return (head, tail)"""
+    if length < 2:
+        return head, head
+
+    tail = None
+    width = 1
+    while width < length:
+        new_head = tail = None
+        current = head
+        while current is not None:
+            left = current
+            right = cutChain(left, width)
+            current = cutChain(right, width)
+            merged_head, merged_tail = mergeChains(left, right, key)
+            if tail is None:
+                new_head = merged_head
+            else:
+                tail.next = merged_head
+            tail = merged_tail
+        head = new_head
+        width <<= 1
+    return head, tail
+
+
+def reverseChain(head):
+    """Reverse a chain in place; return the new head"""
+    previous = None
+    while head is not None:
+        head.next, previous, head = previous, head, head.next
+    return previous
+
+
+def linkPrev(head):
+    """Set every prev pointer from the next pointers (doubly linked chains)"""
+    previous = None
+    while head is not None:
+        head.prev = previous
+        previous = head
+        head = head.next
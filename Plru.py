@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""This is the LRU cache file"""
+
+#Auther Name: Prathamesh Pawar
+#       Email: prathameshpawar1301@gmail.com
+
+"""LRUCache pairs a dict from key to DLL node handle with a DLL kept in
+recency order (most recent at the head). get/put move the node to the
+front with DLL.moveToFront, and eviction pops the tail, so every
+operation is O(1).
+
+The cache is bounded by maxsize entries (None for no limit) and,
+optionally, by maxweight total weight, where weigher(key, value) gives
+an entry's weight. A ttl
+(in seconds, given per cache or per put) makes entries expire. Expired
+entries are dropped lazily when they are looked up. memoize() wraps a
+function with an LRUCache, much like functools.lru_cache."""
+
+import functools
+import time
+
+from Pdll import DLL
+
+class _Entry:
+
+    __slots__ = ('key', 'value', 'weight', 'expires')
+
+    def __init__(self, key, value, weight, expires):
+        self.key = key
+        self.value = value
+        self.weight = weight
+        self.expires = expires
+
+
+class LRUCache:
+
+    def __init__(self, maxsize=128, maxweight=None, weigher=None, ttl=None):
+        self.maxsize = maxsize
+        self.maxweight = maxweight
+        self.weigher = weigher
+        self.ttl = ttl
+        self._map = {}
+        self._order = DLL()
+        self.weight = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self):
+        return len(self._map)
+
+    def __contains__(self, key):
+        node = self._map.get(key)
+        return node is not None and not self._expired(node)
+
+    def __repr__(self):
+        return "LRUCache(size={}, maxsize={}, hits={}, misses={})".format(
+            len(self._map), self.maxsize, self.hits, self.misses)
+
+    def _expired(self, node):
+        expires = node.data.expires
+        if expires is not None and expires <= time.monotonic():
+            self._discard(node)
+            self.expirations += 1
+            return True
+        return False
+
+    def _discard(self, node):
+        entry = self._order.removeNode(node)
+        del self._map[entry.key]
+        self.weight -= entry.weight
+        return entry
+
+    def _evict(self):
+        while self._map and ((self.maxsize is not None and len(self._map) > self.maxsize) or
+                             (self.maxweight is not None and self.weight > self.maxweight)):
+            self._discard(self._order.tail)
+            self.evictions += 1
+
+    def get(self, key, default=None):
+        node = self._map.get(key)
+        if node is None or self._expired(node):
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._order.moveToFront(node)
+        return node.data.value
+
+    def put(self, key, value, ttl=None):
+        ttl = self.ttl if ttl is None else ttl
+        expires = None if ttl is None else time.monotonic() + ttl
+        weight = 1 if self.weigher is None else self.weigher(key, value)
+
+        node = self._map.get(key)
+        if node is not None:
+            self.weight += weight - node.data.weight
+            node.data.value = value
+            node.data.weight = weight
+            node.data.expires = expires
+            self._order.moveToFront(node)
+        else:
+            self._map[key] = self._order.addFront(_Entry(key, value, weight, expires))
+            self.weight += weight
+        self._evict()
+
+    def remove(self, key):
+        node = self._map.get(key)
+        if node is None:
+            return False
+        self._discard(node)
+        return True
+
+    def peekLRU(self):
+        """Return (key, value) of the entry that would be evicted next"""
+        if self._order.tail is None:
+            return None
+        entry = self._order.tail.data
+        return entry.key, entry.value
+
+    def clear(self):
+        self._map.clear()
+        self._order = DLL()
+        self.weight = 0
+
+    def stats(self):
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+            'size': len(self._map),
+            'weight': self.weight,
+        }
+
+
+_KWARGS_MARK = object()
+
+def _makeKey(args, kwargs):
+    if not kwargs:
+        return args[0] if len(args) == 1 and type(args[0]) in (int, str) else args
+    return args + (_KWARGS_MARK,) + tuple(sorted(kwargs.items()))
+
+
+def memoize(maxsize=128, maxweight=None, weigher=None, ttl=None):
+    """Decorator caching a function's results in an LRUCache, exposed as wrapper.cache"""
+    def decorator(func):
+        cache = LRUCache(maxsize, maxweight, weigher, ttl)
+        missing = object()
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = _makeKey(args, kwargs)
+            result = cache.get(key, missing)
+            if result is missing:
+                result = func(*args, **kwargs)
+                cache.put(key, result)
+            return result
+
+        wrapper.cache = cache
+        return wrapper
+
+    if callable(maxsize):
+        func, maxsize = maxsize, 128
+        return decorator(func)
+    return decorator
@@ -6,14 +6,20 @@
 #       Email: prathameshpawar1301@gmail.com
 
 """This Class is created as part of User drived data structes 
-Namely: Linked List, Stack, Queue and Dequeue"""
+Namely: Linked List, Stack, Queue and Dequeue
 
-class Node:
+Nodes declare __slots__ so they carry no per-instance __dict__. SNode is
+the singly linked node used by SLL and the linked stack/queue structures;
+DNode adds the prev pointer needed by DLL. Node is kept as the name of
+the doubly linked node for existing code."""
+
+class SNode:
+
+    __slots__ = ('data', 'next')
 
     def __init__(self, data = None):
         self.data = data
         self.next = None
-        self.prev = None
 
     def __repr__(self):
         return "Node object: data={}".format(self.data)
@@ -34,6 +40,16 @@ class Node:
 
         self.next = new_next
 
+
+class DNode(SNode):
+
+    __slots__ = ('prev',)
+
+    def __init__(self, data = None):
+        self.data = data
+        self.next = None
+        self.prev = None
+
     def getPrev(self):
         
         return self.prev
@@ -41,3 +57,8 @@ class Node:
     def setPrev(self, new_prev):
 
         self.prev = new_prev
+
+
+Node = DNode
+StackNode = SNode
+QueueNode = SNode
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""Filename: Pnodepool.py for the shared node pool"""
+
+#Author Name: Prathamesh Pawar
+#       Email: prathameshpawar1301@gmail.com
+
+"""NodePool keeps removed nodes on a free-list and hands them back out for
+new inserts instead of allocating fresh ones. One pool can be shared by
+many lists of the same node type: SLL(pool=NodePool(SNode)) and
+DLL(pool=NodePool(DNode)). At most `cap` free nodes are kept; nodes
+released beyond that are left to the garbage collector.
+
+A node handle must not be used after its node has been removed from a
+pooled list, because the node may already hold another value."""
+
+from Pnode import DNode
+
+class NodePool:
+
+    def __init__(self, node_class=DNode, cap=1024):
+        self.node_class = node_class
+        self.cap = cap
+        self._free = []
+        self.hits = 0
+        self.misses = 0
+        self.dropped = 0
+
+    def __len__(self):
+        return len(self._free)
+
+    def __repr__(self):
+        return "NodePool({}, size={}, hits={}, misses={})".format(
+            self.node_class.__name__, len(self._free), self.hits, self.misses)
+
+    def acquire(self, data=None):
+        if self._free:
+            self.hits += 1
+            node = self._free.pop()
+            node.data = data
+            return node
+        self.misses += 1
+        return self.node_class(data)
+
+    def release(self, node):
+        if len(self._free) >= self.cap:
+            self.dropped += 1
+            return
+        node.data = None
+        node.next = None
+        if isinstance(node, DNode):
+            node.prev = None
+        self._free.append(node)
+
+    def stats(self):
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'dropped': self.dropped,
+            'size': len(self._free),
+            'cap': self.cap,
+        }
+
+    def clear(self):
+        self._free.clear()
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""This is the persistent stack and queue file"""
+
+#Auther Name: Prathamesh Pawar
+#       Email: prathameshpawar1301@gmail.com
+
+"""PersistentStack and PersistentQueue are immutable. push/pop and
+enqueue/dequeue return a new version and leave the old one untouched, so
+keeping a snapshot costs nothing. Versions share structure instead of
+copying it.
+
+PersistentStack is a cons list of SNode cells. Pushing creates one cell
+whose next points at the old top, so every version shares its tail with
+the versions it came from.
+
+PersistentQueue is a banker's queue made of two PersistentStacks. Items
+are popped from the front stack and pushed onto the rear stack. Whenever
+the rear grows longer than the front, the queue rebuilds its front as
+front ++ reverse(rear). That concatenation is lazy: each front cell is
+built the first time it is popped and then memoized in place. Old
+versions that are popped again reuse the cells already built, so
+enqueue/dequeue stay O(1) amortized across every version, not just the
+newest one."""
+
+from Pnode import SNode
+
+class _Suspension:
+    """Deferred tail of a lazily built cell; forced once, then replaced by its result"""
+
+    __slots__ = ('func', 'args')
+
+    def __init__(self, func, *args):
+        self.func = func
+        self.args = args
+
+
+def _tail(node):
+    following = node.next
+    if type(following) is _Suspension:
+        following = node.next = following.func(*following.args)
+    return following
+
+
+def _reverse(node):
+    reversed_head = None
+    while node is not None:
+        cell = SNode(node.data)
+        cell.next = reversed_head
+        reversed_head = cell
+        node = node.next
+    return reversed_head
+
+
+def _rotate(front, rear):
+    """Lazily build front ++ reverse(rear), one cell per force"""
+    if front is None:
+        return _reverse(rear)
+    cell = SNode(front.data)
+    cell.next = _Suspension(_rotateTail, front, rear)
+    return cell
+
+
+def _rotateTail(front, rear):
+    return _rotate(_tail(front), rear)
+
+
+class PersistentStack:
+
+    __slots__ = ('_top', '_size')
+
+    def __init__(self, iterable=()):
+        top, size = None, 0
+        for item in iterable:
+            cell = SNode(item)
+            cell.next = top
+            top = cell
+            size += 1
+        self._top = top
+        self._size = size
+
+    @classmethod
+    def _make(cls, top, size):
+        stack = cls.__new__(cls)
+        stack._top = top
+        stack._size = size
+        return stack
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        """Iterate from the top of the stack down"""
+        node = self._top
+        while node is not None:
+            yield node.data
+            node = _tail(node)
+
+    def __repr__(self):
+        return "PersistentStack({})".format(list(self)[::-1])
+
+    def push(self, item):
+        cell = SNode(item)
+        cell.next = self._top
+        return PersistentStack._make(cell, self._size + 1)
+
+    def push_many(self, iterable):
+        top, size = self._top, self._size
+        for item in iterable:
+            cell = SNode(item)
+            cell.next = top
+            top = cell
+            size += 1
+        return PersistentStack._make(top, size)
+
+    def pop(self):
+        """Return the stack without its top item (an empty stack pops to itself)"""
+        if self._top is None:
+            return self
+        return PersistentStack._make(_tail(self._top), self._size - 1)
+
+    def peek(self):
+
+        if self._top is not None:
+            return self._top.data
+
+    def size(self):
+
+        return self._size
+
+    def isEmpty(self):
+
+        return self._size == 0
+
+
+_EMPTY_STACK = PersistentStack()
+
+
+class PersistentQueue:
+
+    __slots__ = ('_front', '_rear')
+
+    def __init__(self, iterable=()):
+        self._front = PersistentStack(reversed(list(iterable)))
+        self._rear = _EMPTY_STACK
+
+    @classmethod
+    def _make(cls, front, rear):
+        """Build a version, rotating the rear into the front once it grows longer"""
+        if rear._size > front._size:
+            front = PersistentStack._make(_rotate(front._top, rear._top), front._size + rear._size)
+            rear = _EMPTY_STACK
+        queue = cls.__new__(cls)
+        queue._front = front
+        queue._rear = rear
+        return queue
+
+    def __len__(self):
+        return self._front._size + self._rear._size
+
+    def __iter__(self):
+        """Iterate from the front (oldest) to the rear (newest) item"""
+        yield from self._front
+        yield from list(self._rear)[::-1]
+
+    def __repr__(self):
+        return "PersistentQueue({})".format(list(self))
+
+    def enqueue(self, item):
+        return PersistentQueue._make(self._front, self._rear.push(item))
+
+    def enqueue_many(self, iterable):
+        return PersistentQueue._make(self._front, self._rear.push_many(iterable))
+
+    def dequeue(self):
+        """Return the queue without its front item (an empty queue dequeues to itself)"""
+        if self._front._size == 0:
+            return self
+        return PersistentQueue._make(self._front.pop(), self._rear)
+
+    def peek(self):
+
+        return self._front.peek()
+
+    def size(self):
+
+        return len(self)
+
+    def isEmpty(self):
+
+        return len(self) == 0
@@ -4,27 +4,118 @@
 #Auther Name: Prathamesh Pawar
 #       Email: prathameshpawar1301@gmail.com
 
+"""Queue is backed by a growable circular buffer (ring). The buffer capacity
+is always a power of two so wrap-around is a bit mask instead of a modulo.
+It doubles when full and halves when occupancy drops to a quarter, which
+keeps enqueue/dequeue/peek amortized O(1). Queue(capacity) presizes the
+buffer and never shrinks it below that size."""
+
 class Queue:
 
-    def __init__(self):
-        self.items = []
+    MIN_CAPACITY = 8
+
+    def __init__(self, capacity=MIN_CAPACITY):
+        size = self.MIN_CAPACITY
+        while size < capacity:
+            size <<= 1
+        self._min_capacity = size
+        self._buf = [None] * size
+        self._mask = size - 1
+        self._head = 0
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        """Iterate from the front (oldest) to the rear (newest) item"""
+        buf, mask, head = self._buf, self._mask, self._head
+        for i in range(self._count):
+            yield buf[(head + i) & mask]
+
+    def __repr__(self):
+        return "Queue({})".format(list(self))
+
+    @property
+    def items(self):
+        """Snapshot of the queue in the legacy list layout (rear first)"""
+        return list(self)[::-1]
+
+    def capacity(self):
+        return len(self._buf)
+
+    def _slices(self, start, count):
+        """Split `count` slots from buffer index `start` into at most two runs"""
+        first = min(count, len(self._buf) - start)
+        return (start, start + first), (0, count - first)
+
+    def _resize(self, new_size):
+        buf = self._buf
+        new_buf = [None] * new_size
+        (a, b), (c, d) = self._slices(self._head, self._count)
+        new_buf[:b - a] = buf[a:b]
+        new_buf[b - a:self._count] = buf[c:d]
+        self._buf = new_buf
+        self._mask = new_size - 1
+        self._head = 0
 
     def enqueue(self, item):
-        
-        self.items.insert(0, item)
+        if self._count == len(self._buf):
+            self._resize(len(self._buf) << 1)
+        self._buf[(self._head + self._count) & self._mask] = item
+        self._count += 1
 
     def dequeue(self):
-        if self.items:
-            return self.items.pop()
-        return None
+        if not self._count:
+            return None
+        head = self._head
+        item = self._buf[head]
+        self._buf[head] = None
+        self._head = (head + 1) & self._mask
+        self._count -= 1
+        size = len(self._buf)
+        if size > self._min_capacity and self._count <= size >> 2:
+            self._resize(size >> 1)
+        return item
+
+    def enqueue_many(self, iterable):
+        """Enqueue every item of iterable, copying into the ring slice by slice"""
+        items = list(iterable)
+        needed = self._count + len(items)
+        if needed > len(self._buf):
+            size = len(self._buf)
+            while size < needed:
+                size <<= 1
+            self._resize(size)
+        (a, b), (c, d) = self._slices((self._head + self._count) & self._mask, len(items))
+        self._buf[a:b] = items[:b - a]
+        self._buf[c:d] = items[b - a:]
+        self._count = needed
+
+    def dequeue_many(self, n):
+        """Dequeue up to n items and return them as a list, oldest first"""
+        n = max(0, min(n, self._count))
+        (a, b), (c, d) = self._slices(self._head, n)
+        batch = self._buf[a:b] + self._buf[c:d]
+        self._buf[a:b] = [None] * (b - a)
+        self._buf[c:d] = [None] * (d - c)
+        self._head = (self._head + n) & self._mask
+        self._count -= n
+
+        size = len(self._buf)
+        while size > self._min_capacity and self._count <= size >> 2:
+            size >>= 1
+        if size != len(self._buf):
+            self._resize(size)
+        return batch
 
     def peek(self):
-        if self.items:
-            return self.items[-1]
+        if self._count:
+            return self._buf[self._head]
         return None
 
     def size(self):
-        return len(self.items)
+        return self._count
 
     def isEmpty(self):
-        return self.items == []
+        return self._count == 0
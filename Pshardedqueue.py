@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""This is the sharded multi-producer multi-consumer queue file"""
+
+#Auther Name: Prathamesh Pawar
+#       Email: prathameshpawar1301@gmail.com
+
+"""ShardedQueue splits one logical queue into N shards, each a ring-buffer
+Queue with its own lock. Producers and consumers that work on different
+shards never touch the same lock.
+
+Producers pick a shard with one of two policies. 'round_robin' cycles
+through the shards. 'hash' pins each producer thread to one shard, handed
+out in turn on its first put, so items from that producer stay in FIFO
+order and producers spread evenly over the shards. Thread ids are not
+hashed: on Linux they are aligned addresses that would all land on one
+shard. A
+put with key= always goes to the shard that hash(key) picks. That
+guarantees per-key FIFO: items with the same key come out in the order
+they were put, whichever consumer takes them.
+
+Each consumer thread keeps a cursor. get() starts at the cursor, takes
+the front item of the first non-empty shard, and moves the cursor one
+past that shard. This rotates fairly over the shards, and a consumer
+whose next shard is empty steals from the others. A consumer waits only
+when every shard is empty. Producers signal the shared condition only
+while some consumer is asleep, so the condition stays off the hot path.
+
+With maxsize > 0 each shard holds at most maxsize items, and put returns
+False instead of blocking when the chosen shard is full."""
+
+import itertools
+import os
+import threading
+import time
+
+from Pqueue import Queue
+
+POLICIES = ('round_robin', 'hash')
+IDLE_TIMEOUT = 0.05
+
+class _Shard:
+
+    __slots__ = ('queue', 'lock')
+
+    def __init__(self):
+        self.queue = Queue()
+        self.lock = threading.Lock()
+
+
+class ShardedQueue:
+
+    def __init__(self, shards=None, policy='round_robin', maxsize=0):
+        if policy not in POLICIES:
+            raise ValueError("policy must be one of {}".format(POLICIES))
+        count = shards or os.cpu_count() or 1
+        self._shards = [_Shard() for _ in range(count)]
+        self.policy = policy
+        self.maxsize = maxsize
+        self._ticket = itertools.count()
+        self._producer_ticket = itertools.count()
+        self._local = threading.local()
+        self._cond = threading.Condition()
+        self._sleepers = 0
+
+    def __len__(self):
+        return sum(len(shard.queue) for shard in self._shards)
+
+    def __repr__(self):
+        return "ShardedQueue(shards={}, policy={!r}, size={})".format(
+            len(self._shards), self.policy, len(self))
+
+    def size(self):
+        return len(self)
+
+    def isEmpty(self):
+        return len(self) == 0
+
+    def _shardFor(self, key):
+        count = len(self._shards)
+        if key is not None:
+            return hash(key) % count
+        if self.policy == 'hash':
+            shard = getattr(self._local, 'shard', None)
+            if shard is None:
+                shard = self._local.shard = next(self._producer_ticket) % count
+            return shard
+        return next(self._ticket) % count
+
+    def _signal(self):
+        with self._cond:
+            self._cond.notify_all()
+
+    def put(self, item, key=None):
+        """Add item to a shard; items with the same key keep their FIFO order"""
+        shard = self._shards[self._shardFor(key)]
+        with shard.lock:
+            if 0 < self.maxsize <= len(shard.queue):
+                return False
+            shard.queue.enqueue(item)
+        if self._sleepers:
+            self._signal()
+        return True
+
+    def put_many(self, items, key=None):
+        """Add items to one shard under a single lock; return how many fit"""
+        items = list(items)
+        shard = self._shards[self._shardFor(key)]
+        with shard.lock:
+            if self.maxsize > 0:
+                items = items[:max(0, self.maxsize - len(shard.queue))]
+            shard.queue.enqueue_many(items)
+        if items and self._sleepers:
+            self._signal()
+        return len(items)
+
+    def _take(self, max_items):
+        """Pop from the first non-empty shard after this consumer's cursor: one item
+        when max_items is None, else a list of up to max_items. Returns (found, batch)
+        so that a None item is not mistaken for an empty queue"""
+        count = len(self._shards)
+        cursor = getattr(self._local, 'cursor', None)
+        if cursor is None:
+            cursor = next(self._ticket) % count
+        for offset in range(count):
+            index = (cursor + offset) % count
+            shard = self._shards[index]
+            if not shard.queue:
+                continue
+            with shard.lock:
+                if not shard.queue:
+                    continue
+                if max_items is None:
+                    batch = shard.queue.dequeue()
+                else:
+                    batch = shard.queue.dequeue_many(max_items)
+            self._local.cursor = (index + 1) % count
+            return True, batch
+        self._local.cursor = cursor
+        return False, None
+
+    def _wait(self, max_items, timeout):
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            found, batch = self._take(max_items)
+            if found:
+                return batch
+            with self._cond:
+                self._sleepers += 1
+                try:
+                    # re-check now that producers can see we are asleep
+                    found, batch = self._take(max_items)
+                    if found:
+                        return batch
+                    wait = IDLE_TIMEOUT
+                    if deadline is not None:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            return None
+                        wait = min(wait, remaining)
+                    self._cond.wait(wait)
+                finally:
+                    self._sleepers -= 1
+
+    def get(self, timeout=None):
+        """Take the next item, waiting up to timeout seconds; None on timeout"""
+        return self._wait(None, timeout)
+
+    def get_many(self, max_items, timeout=None):
+        """Take up to max_items from one shard, in that shard's FIFO order; [] on timeout"""
+        batch = self._wait(max(1, max_items), timeout)
+        return [] if batch is None else batch
+
+    def get_nowait(self):
+        return self._take(None)[1]
+
+    def stats(self):
+        return {
+            'shards': len(self._shards),
+            'sizes': [len(shard.queue) for shard in self._shards],
+            'sleepers': self._sleepers,
+        }
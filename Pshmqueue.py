@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""This is the shared memory queue file"""
+
+#Auther Name: Prathamesh Pawar
+#       Email: prathameshpawar1301@gmail.com
+
+"""SharedMemoryQueue is a fixed-slot ring buffer in a
+multiprocessing.shared_memory block. It has the Queue method names
+(enqueue, dequeue, peek, size, isEmpty) and carries bytes-like records,
+so processes exchange data without pickling each item through a pipe.
+
+Layout: the head and tail counters sit on separate cache lines and only
+ever increase, so slot = counter % slots. Each slot holds a 4-byte
+length followed by the payload. A record is written before the tail is
+published, and read before the head is published. With one producer
+and one consumer ('spsc', the default) no lock is taken. Mode 'mpmc'
+serialises producers on one multiprocessing.Lock and consumers on
+another.
+
+The creating process owns the block and should call unlink() when done.
+Other processes get the queue by passing it to multiprocessing.Process
+(it pickles as a reference to the block and, for 'mpmc', its locks). An
+'spsc' queue can also be attached by SharedMemoryQueue(name=...,
+create=False). The mode is stored in the block, so an attacher always
+runs in the creator's mode. Attaching to an 'mpmc' queue by name needs
+locks=(put_lock, get_lock) from the creator, because a multiprocessing
+lock cannot be looked up by name."""
+
+import multiprocessing
+import struct
+from multiprocessing import shared_memory
+
+HEAD_OFFSET = 0
+TAIL_OFFSET = 64
+META_OFFSET = 128
+DATA_OFFSET = 192
+COUNTER = struct.Struct('Q')
+META = struct.Struct('III')
+MODES = ('spsc', 'mpmc')
+LENGTH = struct.Struct('I')
+
+class SharedMemoryQueue:
+
+    def __init__(self, slots=1024, slot_size=256, mode=None, name=None, create=True, locks=None):
+        if mode is not None and mode not in MODES:
+            raise ValueError("mode must be 'spsc' or 'mpmc'")
+        if create:
+            mode = mode or 'spsc'
+            self._shm = shared_memory.SharedMemory(name=name, create=True,
+                                                   size=DATA_OFFSET + slots * slot_size)
+            COUNTER.pack_into(self._shm.buf, HEAD_OFFSET, 0)
+            COUNTER.pack_into(self._shm.buf, TAIL_OFFSET, 0)
+            META.pack_into(self._shm.buf, META_OFFSET, slots, slot_size, MODES.index(mode))
+        else:
+            self._shm = shared_memory.SharedMemory(name=name)
+            slots, slot_size, stored = META.unpack_from(self._shm.buf, META_OFFSET)
+            if mode is not None and mode != MODES[stored]:
+                self._shm.close()
+                raise ValueError("queue {!r} was created in mode {!r}".format(name, MODES[stored]))
+            mode = MODES[stored]
+            if mode == 'mpmc' and locks is None:
+                self._shm.close()
+                raise ValueError("attaching to an 'mpmc' queue by name needs the creator's locks=")
+        self.mode = mode
+        self.slots = slots
+        self.slot_size = slot_size
+        self.max_record = slot_size - LENGTH.size
+        self._buf = self._shm.buf
+
+        if locks is None and mode == 'mpmc':
+            locks = (multiprocessing.Lock(), multiprocessing.Lock())
+        self._put_lock, self._get_lock = locks or (None, None)
+
+    def __reduce__(self):
+        return (SharedMemoryQueue, (self.slots, self.slot_size, self.mode, self.name,
+                                    False, (self._put_lock, self._get_lock)))
+
+    def __len__(self):
+        return self.size()
+
+    def __repr__(self):
+        return "SharedMemoryQueue(name={!r}, size={}, slots={})".format(
+            self.name, self.size(), self.slots)
+
+    @property
+    def name(self):
+        return self._shm.name
+
+    def _head(self):
+        return COUNTER.unpack_from(self._buf, HEAD_OFFSET)[0]
+
+    def _tail(self):
+        return COUNTER.unpack_from(self._buf, TAIL_OFFSET)[0]
+
+    def _offset(self, counter):
+        return DATA_OFFSET + (counter % self.slots) * self.slot_size
+
+    def _enqueue(self, record):
+        tail = self._tail()
+        if tail - self._head() >= self.slots:
+            return False
+        offset = self._offset(tail)
+        LENGTH.pack_into(self._buf, offset, len(record))
+        start = offset + LENGTH.size
+        self._buf[start:start + len(record)] = record
+        COUNTER.pack_into(self._buf, TAIL_OFFSET, tail + 1)
+        return True
+
+    def _read(self, advance):
+        head = self._head()
+        if head == self._tail():
+            return None
+        offset = self._offset(head)
+        length = LENGTH.unpack_from(self._buf, offset)[0]
+        start = offset + LENGTH.size
+        record = bytes(self._buf[start:start + length])
+        if advance:
+            COUNTER.pack_into(self._buf, HEAD_OFFSET, head + 1)
+        return record
+
+    def enqueue(self, record):
+        """Append a bytes-like record; returns False when the ring is full"""
+        if len(record) > self.max_record:
+            raise ValueError("record of {} bytes exceeds slot payload of {} bytes".format(
+                len(record), self.max_record))
+        if self._put_lock is None:
+            return self._enqueue(record)
+        with self._put_lock:
+            return self._enqueue(record)
+
+    def dequeue(self):
+        if self._get_lock is None:
+            return self._read(True)
+        with self._get_lock:
+            return self._read(True)
+
+    def peek(self):
+        if self._get_lock is None:
+            return self._read(False)
+        with self._get_lock:
+            return self._read(False)
+
+    def size(self):
+        head = self._head()
+        return self._tail() - head
+
+    def isEmpty(self):
+        return self.size() == 0
+
+    def isFull(self):
+        return self.size() >= self.slots
+
+    def close(self):
+        self._buf = None
+        self._shm.close()
+
+    def unlink(self):
+        self._shm.unlink()
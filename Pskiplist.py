@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+
+"""filename: Pskiplist.py for Skip list ordered map"""
+#Author name: Prathamesh Pawar
+#       email: prathameshpawar1301@gmail.com
+
+##################################################################################################################
+# supporting meathods
+##  isEmpty
+##  size
+##  search
+##  get
+##  insert
+##  remove
+##  range
+##  rank     (indexable mode)
+##  select   (indexable mode)
+##################################################################################################################
+"""SkipList is an ordered map of keys to values. Its nodes are linked like
+the Pnode nodes, but each SkipNode has a list of next pointers, one per
+level. A node is promoted to each further level with probability p, so
+search, insert and remove take O(log n) expected time. range() visits
+the k keys in [lo, hi) in O(log n + k).
+
+SkipList(indexable=True) also stores width[i], the number of level-0
+steps covered by next[i]. rank(key) and select(index) then run in
+O(log n). Updates only relink the nodes next to the changed key, with
+none of the rotations that trees/avl_tree.py needs to stay balanced."""
+
+import random
+
+class SkipNode:
+
+    __slots__ = ('key', 'value', 'next', 'width')
+
+    def __init__(self, key, value, level, indexable):
+        self.key = key
+        self.value = value
+        self.next = [None] * level
+        self.width = [0] * level if indexable else None
+
+    def __repr__(self):
+        return "SkipNode object: key={} value={}".format(self.key, self.value)
+
+    def getData(self):
+
+        return self.key
+
+    def getNext(self, level=0):
+
+        return self.next[level]
+
+
+class SkipList:
+
+    def __init__(self, indexable=False, max_level=32, p=0.5, seed=None):
+        self.indexable = indexable
+        self.max_level = max_level
+        self.p = p
+        self._random = random.Random(seed)
+        self.head = SkipNode(None, None, max_level, indexable)
+        self.level = 1
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        current = self.head.next[0]
+        while current is not None:
+            yield current.key
+            current = current.next[0]
+
+    def __contains__(self, key):
+        return self._find(key) is not None
+
+    def __repr__(self):
+        return "SkipList({})".format(list(self.items()))
+
+    def items(self):
+        current = self.head.next[0]
+        while current is not None:
+            yield current.key, current.value
+            current = current.next[0]
+
+    def isEmpty(self):
+        return self._size == 0
+
+    def size(self):
+        return self._size
+
+    def _randomLevel(self):
+        level = 1
+        while level < self.max_level and self._random.random() < self.p:
+            level += 1
+        return level
+
+    def _path(self, key):
+        """Return (update, rank): the last node before key on every level and its position"""
+        update = [self.head] * self.max_level
+        rank = [0] * self.max_level
+        current = self.head
+        position = 0
+        for i in reversed(range(self.level)):
+            following = current.next[i]
+            while following is not None and following.key < key:
+                if self.indexable:
+                    position += current.width[i]
+                current = following
+                following = current.next[i]
+            update[i] = current
+            rank[i] = position
+        return update, rank
+
+    def _find(self, key):
+        current = self.head
+        for i in reversed(range(self.level)):
+            following = current.next[i]
+            while following is not None and following.key < key:
+                current = following
+                following = current.next[i]
+        current = current.next[0]
+        if current is not None and current.key == key:
+            return current
+        return None
+
+    def search(self, key):
+        return self._find(key) is not None
+
+    def get(self, key, default=None):
+        node = self._find(key)
+        return default if node is None else node.value
+
+    def insert(self, key, value=None):
+        """Insert key (or update its value); returns True if the key was new"""
+        update, rank = self._path(key)
+        following = update[0].next[0]
+        if following is not None and following.key == key:
+            following.value = value
+            return False
+
+        level = self._randomLevel()
+        if level > self.level:
+            for i in range(self.level, level):
+                update[i] = self.head
+                rank[i] = 0
+                if self.indexable:
+                    self.head.width[i] = self._size + 1
+            self.level = level
+
+        node = SkipNode(key, value, level, self.indexable)
+        for i in range(level):
+            node.next[i] = update[i].next[i]
+            update[i].next[i] = node
+            if self.indexable:
+                node.width[i] = update[i].width[i] - (rank[0] - rank[i])
+                update[i].width[i] = rank[0] - rank[i] + 1
+        if self.indexable:
+            for i in range(level, self.level):
+                update[i].width[i] += 1
+        self._size += 1
+        return True
+
+    def remove(self, key):
+        update, _ = self._path(key)
+        node = update[0].next[0]
+        if node is None or node.key != key:
+            return False
+
+        for i in range(self.level):
+            if update[i].next[i] is node:
+                update[i].next[i] = node.next[i]
+                if self.indexable:
+                    update[i].width[i] += node.width[i] - 1
+            elif self.indexable:
+                update[i].width[i] -= 1
+        while self.level > 1 and self.head.next[self.level - 1] is None:
+            self.level -= 1
+        self._size -= 1
+        return True
+
+    def range(self, lo=None, hi=None):
+        """Yield (key, value) for lo <= key < hi in order; None leaves a bound open"""
+        if lo is None:
+            current = self.head.next[0]
+        else:
+            update, _ = self._path(lo)
+            current = update[0].next[0]
+        while current is not None and (hi is None or current.key < hi):
+            yield current.key, current.value
+            current = current.next[0]
+
+    def rank(self, key):
+        """Index of key in sorted order, or None when absent (indexable mode)"""
+        if not self.indexable:
+            raise TypeError("rank() needs SkipList(indexable=True)")
+        update, rank = self._path(key)
+        node = update[0].next[0]
+        if node is None or node.key != key:
+            return None
+        return rank[0]
+
+    def select(self, index):
+        """Key at position index in sorted order (indexable mode)"""
+        if not self.indexable:
+            raise TypeError("select() needs SkipList(indexable=True)")
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("skip list index out of range")
+
+        target = index + 1
+        current = self.head
+        position = 0
+        for i in reversed(range(self.level)):
+            while current.next[i] is not None and position + current.width[i] <= target:
+                position += current.width[i]
+                current = current.next[i]
+        return current.key
+
+    def __getitem__(self, index):
+        return self.select(index)
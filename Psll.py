@@ -5,42 +5,104 @@
 #Author Name: Prathamesh Pawar
 #       Email: prathameshpawar1301@gmail.com
 
-"""Including Node class to create and traverse the link list"""
+"""SLL(indexed=True) keeps a NodeIndex from value to node so search and
+remove by value are O(1) on average. A matched node is removed by copying
+its successor into it, so only removing the tail node still walks the list.
+
+SLL(pool=NodePool(SNode)) draws new nodes from the pool and returns
+removed nodes to it.
+
+sort, merge, dedupe and reverse relink the existing nodes in place (see
+Plinkops.py) and never allocate new ones; each takes an optional key."""
+
+"""Including SNode class to create and traverse the link list"""
 from Pnode import *
+from Pindex import NodeIndex
+from Plinkops import mergeChains, reverseChain, sortChain
 
 class SLL:
 
-    def __init__(self):
+    def __init__(self, indexed=False, pool=None):
         self.head = None
+        self.tail = None
+        self._size = 0
+        self._index = NodeIndex() if indexed else None
+        self._pool = pool
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        current = self.head
+        while current is not None:
+            yield current.data
+            current = current.next
+
+    def __reversed__(self):
+        """Singly linked, so reverse iteration buffers the values first"""
+        return reversed(list(self))
 
     def __repr__(self):
         return "Node obbject: data = {}".format(self.data)
 
+    def _newNode(self, new_data):
+        if self._pool is None:
+            return SNode(new_data)
+        return self._pool.acquire(new_data)
+
+    def _freeNode(self, node):
+        if self._pool is not None:
+            self._pool.release(node)
+
     def isEmpty(self):
         return self.head is None
 
     def addFront(self, new_data):
-        temp  = Node(new_data)
+        temp  = self._newNode(new_data)
         temp.setNext(self.head)
         self.head = temp
+        if self.tail is None:
+            self.tail = temp
+        self._size += 1
+        if self._index is not None:
+            self._index.add(temp, front=True)
+
+    def addRear(self, new_data):
+        temp = self._newNode(new_data)
+        if self.tail is None:
+            self.head = temp
+        else:
+            self.tail.setNext(temp)
+        self.tail = temp
+        self._size += 1
+        if self._index is not None:
+            self._index.add(temp)
 
-    def size(self):
-        size = 0
+    def popFront(self):
+        if self.head is None:
+            return None
 
-        if self.head == None:
-            return 0
-        
-        current = self.head
-        while current is not None: #while there are nodes to count
-            size += 1
-            current = current.getNext()
+        temp = self.head
+        self.head = temp.getNext()
+        if self.head is None:
+            self.tail = None
+        self._size -= 1
+        if self._index is not None:
+            self._index.discard(temp)
+        data = temp.getData()
+        self._freeNode(temp)
+        return data
 
-        return size
+    def size(self):
+        return self._size
 
     def search(self, data):
         if self.head is None:
             return "Linked List is empty. No Nodes to search."
 
+        if self._index is not None:
+            return data in self._index
+
         current = self.head
         while current is not None:
             if current.getData() == data:
@@ -54,6 +116,13 @@ class SLL:
         if self.head is None:
             return "Empty List, No nodes to remove"
 
+        if self._index is not None:
+            current = self._index.first(data)
+            if current is None:
+                return "A node with that value is not present."
+            self._removeIndexed(current)
+            return
+
         current =  self.head
         previous = None
         found = False
@@ -71,3 +140,88 @@ class SLL:
             self.head = current.getNext()
         else:
             previous.setNext(current.getNext())
+
+        if current is self.tail:
+            self.tail = previous
+        self._size -= 1
+        self._freeNode(current)
+
+
+    def _removeIndexed(self, current):
+        self._index.discard(current)
+        following = current.getNext()
+
+        if following is None:
+            if current is self.head:
+                self.head = None
+                self.tail = None
+            else:
+                previous = self.head
+                while previous.getNext() is not current:
+                    previous = previous.getNext()
+                previous.setNext(None)
+                self.tail = previous
+            self._freeNode(current)
+        else:
+            self._index.replace(following, current)
+            current.setData(following.getData())
+            current.setNext(following.getNext())
+            if following is self.tail:
+                self.tail = current
+            self._freeNode(following)
+        self._size -= 1
+
+    def _reindex(self):
+        """Rebuild the value index after nodes were reordered"""
+        if self._index is None:
+            return
+        self._index.clear()
+        current = self.head
+        while current is not None:
+            self._index.add(current)
+            current = current.getNext()
+
+    def sort(self, key=None):
+        """Stable in-place bottom-up merge sort, O(n log n), by relinking nodes"""
+        self.head, self.tail = sortChain(self.head, self._size, key)
+        self._reindex()
+
+    def merge(self, other, key=None):
+        """Merge the sorted list `other` into this sorted list in O(n + m), leaving `other` empty"""
+        if other is self or other.head is None:
+            return
+        self.head, self.tail = mergeChains(self.head, other.head, key)
+        self._size += other._size
+        other.head = other.tail = None
+        other._size = 0
+        if other._index is not None:
+            other._index.clear()
+        self._reindex()
+
+    def dedupe(self, key=None):
+        """Remove nodes equal to their predecessor, keeping the first of each run; return the count removed"""
+        removed = 0
+        current = self.head
+        while current is not None and current.getNext() is not None:
+            following = current.getNext()
+            if key is None:
+                same = following.getData() == current.getData()
+            else:
+                same = key(following.getData()) == key(current.getData())
+            if same:
+                current.setNext(following.getNext())
+                if self._index is not None:
+                    self._index.discard(following)
+                self._freeNode(following)
+                removed += 1
+            else:
+                current = following
+        self.tail = current
+        self._size -= removed
+        return removed
+
+    def reverse(self):
+        """Reverse the list in place in O(n)"""
+        self.tail = self.head
+        self.head = reverseChain(self.head)
+        self._reindex()
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""This is the disk backed spill queue file"""
+
+#Auther Name: Prathamesh Pawar
+#       Email: prathameshpawar1301@gmail.com
+
+"""SpillQueue keeps at most `memory_items` items in an in-memory head and
+as many again in an in-memory tail. When the tail fills up, it is
+appended to segment files in `directory`. Each record is a 4-byte length
+followed by the pickled item. When the head runs dry it is refilled from
+the oldest segment through mmap, and then from the tail once the disk is
+empty. A segment is deleted once all of its records have been dequeued
+and committed.
+
+The committed read position (segment id, byte offset) is written
+atomically to a `cursor` file. This happens every `commit_every`
+dequeues, when commit() is called, and on flush() and close(). Opening a
+SpillQueue on an existing directory resumes from that position, so
+spilled items dequeued after the last commit are delivered again
+(at-least-once). Every spill is fsynced, so spilled items survive an OS
+crash. Items held only in memory survive a clean close() or flush(), but
+not a crash. A torn record at the end of a segment is
+ignored."""
+
+import mmap
+import os
+import pickle
+import struct
+
+from Pqueue import Queue
+from Pdeque import Deque
+
+RECORD = struct.Struct('I')
+SEGMENT = 'segment-{:020d}.log'
+CURSOR = 'cursor'
+FIRST_SEGMENT_ID = 1 << 32
+
+class SpillQueue:
+
+    def __init__(self, directory, memory_items=10000, segment_bytes=64 << 20, commit_every=1024):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.memory_items = max(1, memory_items)
+        self.segment_bytes = segment_bytes
+        self.commit_every = commit_every
+
+        # head entries are (item, position); position is (segment id, end offset)
+        # for records read from disk and None for items that never left memory
+        self._head = Queue()
+        self._head_on_disk = False
+        self._tail = Queue()
+
+        self._segments = Deque()
+        self._exhausted = Deque()
+        self._reader = None
+        self._writer = None
+        self._writer_id = None
+        self._disk_count = 0
+        self._position = None
+        self._uncommitted = 0
+        self._recover()
+
+    def __len__(self):
+        return self.size()
+
+    def __repr__(self):
+        return "SpillQueue({!r}, size={}, on_disk={})".format(
+            self.directory, self.size(), self._disk_count)
+
+    def _path(self, segment_id):
+        return os.path.join(self.directory, SEGMENT.format(segment_id))
+
+    def _recover(self):
+        ids = sorted(int(name[8:-4]) for name in os.listdir(self.directory)
+                     if name.startswith('segment-') and name.endswith('.log'))
+        cursor_id, cursor_offset = None, 0
+        cursor_path = os.path.join(self.directory, CURSOR)
+        if os.path.exists(cursor_path):
+            with open(cursor_path) as cursor:
+                cursor_id, cursor_offset = map(int, cursor.read().split())
+
+        for segment_id in ids:
+            if cursor_id is not None and segment_id < cursor_id:
+                os.remove(self._path(segment_id))
+                continue
+            offset = cursor_offset if segment_id == cursor_id else 0
+            self._segments.addRear((segment_id, offset))
+            self._disk_count += sum(1 for _ in self._scan(segment_id, offset))
+
+        # never reuse the cursor's segment id: its stale offset would skip new records
+        last_id = max(ids[-1] if ids else FIRST_SEGMENT_ID - 1,
+                      cursor_id if cursor_id is not None else FIRST_SEGMENT_ID - 1)
+        self._next_id = last_id + 1
+
+    def _scan(self, segment_id, offset):
+        """Yield (payload, end offset) for the complete records of a segment"""
+        with open(self._path(segment_id), 'rb') as segment:
+            size = os.fstat(segment.fileno()).st_size
+            if size <= offset:
+                return
+            with mmap.mmap(segment.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                while offset + RECORD.size <= size:
+                    length = RECORD.unpack_from(view, offset)[0]
+                    end = offset + RECORD.size + length
+                    if end > size:
+                        return
+                    yield view[offset + RECORD.size:end], end
+                    offset = end
+
+    def _closeWriter(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+            self._writer_id = None
+
+    def _writeSegment(self, segment_id, items):
+        with open(self._path(segment_id), 'ab') as segment:
+            segment.write(self._encode(items))
+            segment.flush()
+            os.fsync(segment.fileno())
+
+    def _encode(self, items):
+        chunks = []
+        for item in items:
+            payload = pickle.dumps(item, pickle.HIGHEST_PROTOCOL)
+            chunks.append(RECORD.pack(len(payload)))
+            chunks.append(payload)
+        return b''.join(chunks)
+
+    def _spill(self):
+        if not self._tail.size():
+            return
+        if self._writer is None or self._writer.tell() >= self.segment_bytes:
+            self._closeWriter()
+            self._writer_id = self._next_id
+            self._next_id += 1
+            self._writer = open(self._path(self._writer_id), 'ab')
+            self._segments.addRear((self._writer_id, 0))
+
+        count = self._tail.size()
+        self._writer.write(self._encode(self._tail.dequeue()[0] for _ in range(count)))
+        self._writer.flush()
+        os.fsync(self._writer.fileno())
+        self._disk_count += count
+
+    def _openReader(self):
+        segment_id, offset = self._segments.removeFront()
+        if segment_id == self._writer_id:
+            self._closeWriter()
+        self._reader = (segment_id, self._scan(segment_id, offset))
+
+    def _refill(self):
+        while self._head.size() < self.memory_items and (self._reader or self._segments.size()):
+            if self._reader is None:
+                self._openReader()
+            segment_id, records = self._reader
+            for payload, end in records:
+                self._head.enqueue((pickle.loads(payload), (segment_id, end)))
+                self._disk_count -= 1
+                if self._head.size() >= self.memory_items:
+                    break
+            else:
+                self._exhausted.addRear(segment_id)
+                self._reader = None
+        self._head_on_disk = self._head.size() > 0
+
+        if not self._head.size():
+            self._head, self._tail = self._tail, self._head
+
+    def _onDisk(self):
+        return self._reader is not None or self._segments.size() > 0
+
+    def enqueue(self, item):
+        if (not self._head_on_disk and not self._onDisk() and not self._tail.size()
+                and self._head.size() < self.memory_items):
+            self._head.enqueue((item, None))
+            return
+        self._tail.enqueue((item, None))
+        if self._tail.size() >= self.memory_items:
+            self._spill()
+
+    def dequeue(self):
+        if not self._head.size():
+            self._refill()
+            if not self._head.size():
+                return None
+
+        item, position = self._head.dequeue()
+        if position is not None:
+            self._position = position
+            self._uncommitted += 1
+            if self._uncommitted >= self.commit_every:
+                self.commit()
+        if not self._head.size():
+            self._head_on_disk = False
+        return item
+
+    def peek(self):
+        if not self._head.size():
+            self._refill()
+        entry = self._head.peek()
+        return None if entry is None else entry[0]
+
+    def size(self):
+        return self._head.size() + self._disk_count + self._tail.size()
+
+    def isEmpty(self):
+        return self.size() == 0
+
+    def commit(self):
+        """Persist the read position and delete fully consumed segments"""
+        self._uncommitted = 0
+        if self._position is None:
+            return
+        segment_id, offset = self._position
+        temp_path = os.path.join(self.directory, CURSOR + '.tmp')
+        with open(temp_path, 'w') as cursor:
+            cursor.write("{} {}".format(segment_id, offset))
+            cursor.flush()
+            os.fsync(cursor.fileno())
+        os.replace(temp_path, os.path.join(self.directory, CURSOR))
+
+        while self._exhausted.size():
+            exhausted_id = self._exhausted.peekFront()
+            if exhausted_id > segment_id:
+                break
+            if exhausted_id == segment_id and offset < os.path.getsize(self._path(segment_id)):
+                break
+            os.remove(self._path(self._exhausted.removeFront()))
+
+    def flush(self):
+        """Move every in-memory item to disk so that all pending items survive a crash"""
+        self.commit()
+        if self._head.size() and not self._head_on_disk:
+            # memory-only head items precede everything on disk: prepend a segment
+            if self._segments.size():
+                segment_id = self._segments.peekFront()[0] - 1
+            else:
+                segment_id = self._next_id
+                self._next_id += 1
+            # the id may belong to a consumed segment the cursor still points into:
+            # drop that file and commit offset 0 before writing, so neither the old
+            # records nor the stale offset survive a crash
+            if self._exhausted.size() and self._exhausted.peekRear() == segment_id:
+                self._exhausted.removeRear()
+            if os.path.exists(self._path(segment_id)):
+                os.remove(self._path(segment_id))
+            self._position = (segment_id, 0)
+            self.commit()
+            count = self._head.size()
+            self._writeSegment(segment_id, (self._head.dequeue()[0] for _ in range(count)))
+            self._segments.addFront((segment_id, 0))
+            self._disk_count += count
+        self._spill()
+        self._closeWriter()
+
+    def close(self):
+        self.flush()
+        self._reader = None
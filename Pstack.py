@@ -4,27 +4,55 @@
 #Auther Name: Prathamesh Pawar
 #       Email: prathameshpawar1301@gmail.com
 
-"""This is Stack class"""
+"""This is Stack class
+
+Pstack(typecode='q') (or 'i', 'd', ...) stores the items unboxed in an
+array.array instead of a list. view() then returns a zero-copy memoryview
+of the live items, which NumPy can wrap with numpy.frombuffer. The array
+cannot grow or shrink while a view is held, so release the view before
+pushing or popping again."""
+
+from array import array
 
 class Pstack:
 
-    def __init__(self):
-        self.items = []
+    def __init__(self, typecode=None):
+        self.typecode = typecode
+        self.items = [] if typecode is None else array(typecode)
+
+    def __len__(self):
+        return len(self.items)
 
     def push(self, item):
 
         self.items.append(item)
 
+    def push_many(self, iterable):
+
+        self.items.extend(iterable)
+
     def pop(self):
 
         if self.items:
             return self.items.pop()
 
+    def pop_many(self, k):
+        """Pop up to k items; returned in push order, so the former top is last"""
+        if k <= 0:
+            return self.items[:0]
+        batch = self.items[-k:]
+        del self.items[-k:]
+        return batch
 
     def peek(self):
 
         return self.items[-1]
 
+    def view(self):
+        """Zero-copy memoryview of the stack, bottom first (typed stacks only)"""
+        if self.typecode is None:
+            raise TypeError("view() needs a typed stack, e.g. Pstack(typecode='q')")
+        return memoryview(self.items)
 
     def size(self):
 
@@ -32,4 +60,4 @@ class Pstack:
 
     def isEmpty(self):
 
-        return self.items == []
+        return len(self.items) == 0
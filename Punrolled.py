@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+
+"""This file includes unrolled linked list class"""
+
+#Author Name: Prathamesh Pawar
+#       Email: prathameshpawar1301@gmail.com
+
+"""UnrolledLL is a singly linked list whose nodes each hold a small list
+of up to `capacity` elements. A full node is split in half on insert. A
+node that falls below half full on delete takes items from its successor,
+or merges with it when both fit in one node. Indexing and middle
+insertion walk n/capacity nodes instead of n, and iteration touches one
+node object per `capacity` elements."""
+
+class UnrolledNode:
+
+    __slots__ = ('items', 'next')
+
+    def __init__(self, items=None):
+        self.items = [] if items is None else items
+        self.next = None
+
+    def __repr__(self):
+        return "UnrolledNode object: items={}".format(self.items)
+
+
+class UnrolledLL:
+
+    def __init__(self, iterable=(), capacity=64):
+        self.capacity = max(2, capacity)
+        self.head = None
+        self.tail = None
+        self._size = 0
+        for item in iterable:
+            self.addRear(item)
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        current = self.head
+        while current is not None:
+            yield from current.items
+            current = current.next
+
+    def __reversed__(self):
+        """Singly linked, so reverse iteration buffers the values first"""
+        return reversed(list(self))
+
+    def __repr__(self):
+        return "UnrolledLL({})".format(list(self))
+
+    def isEmpty(self):
+        return self._size == 0
+
+    def size(self):
+        return self._size
+
+    def nodeCount(self):
+        count = 0
+        current = self.head
+        while current is not None:
+            count += 1
+            current = current.next
+        return count
+
+    def _locate(self, index):
+        """Return (previous node, node, offset) for position index; previous may be
+        None for the tail node, and is then looked up only if it is needed"""
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("list index out of range")
+
+        if index >= self._size - len(self.tail.items):
+            return None, self.tail, index - (self._size - len(self.tail.items))
+
+        previous = None
+        current = self.head
+        while index >= len(current.items):
+            index -= len(current.items)
+            previous = current
+            current = current.next
+        return previous, current, index
+
+    def _before(self, node):
+        current = self.head
+        while current.next is not node:
+            current = current.next
+        return current
+
+    def _split(self, node):
+        half = len(node.items) // 2
+        fresh = UnrolledNode(node.items[half:])
+        del node.items[half:]
+        fresh.next = node.next
+        node.next = fresh
+        if node is self.tail:
+            self.tail = fresh
+
+    def _rebalance(self, previous, node):
+        """Fix up a node that dropped below half capacity"""
+        if not node.items:
+            if node is self.head:
+                self.head = node.next
+            else:
+                previous = previous or self._before(node)
+                previous.next = node.next
+            if node is self.tail:
+                self.tail = previous
+            return
+
+        following = node.next
+        if following is None or len(node.items) >= self.capacity // 2:
+            return
+        if len(node.items) + len(following.items) <= self.capacity:
+            node.items.extend(following.items)
+            node.next = following.next
+            if following is self.tail:
+                self.tail = node
+        else:
+            take = (len(following.items) - len(node.items)) // 2
+            node.items.extend(following.items[:take])
+            del following.items[:take]
+
+    def __getitem__(self, index):
+        _, node, offset = self._locate(index)
+        return node.items[offset]
+
+    def __setitem__(self, index, item):
+        _, node, offset = self._locate(index)
+        node.items[offset] = item
+
+    def __delitem__(self, index):
+        self.pop(index)
+
+    def addFront(self, item):
+        if self.head is None or len(self.head.items) >= self.capacity:
+            node = UnrolledNode([item])
+            node.next = self.head
+            self.head = node
+            if self.tail is None:
+                self.tail = node
+        else:
+            self.head.items.insert(0, item)
+        self._size += 1
+
+    def addRear(self, item):
+        if self.tail is None or len(self.tail.items) >= self.capacity:
+            node = UnrolledNode([item])
+            if self.tail is None:
+                self.head = node
+            else:
+                self.tail.next = node
+            self.tail = node
+        else:
+            self.tail.items.append(item)
+        self._size += 1
+
+    def insert(self, index, item):
+        """Insert item before position index (appends when index >= len)"""
+        if index < 0:
+            index = max(0, index + self._size)
+        if index >= self._size:
+            self.addRear(item)
+            return
+        _, node, offset = self._locate(index)
+        node.items.insert(offset, item)
+        self._size += 1
+        if len(node.items) > self.capacity:
+            self._split(node)
+
+    def pop(self, index=-1):
+        if not self._size:
+            return None
+        previous, node, offset = self._locate(index)
+        item = node.items.pop(offset)
+        self._size -= 1
+        self._rebalance(previous, node)
+        return item
+
+    def popFront(self):
+        return self.pop(0)
+
+    def search(self, data):
+        if self.head is None:
+            return "Linked List is empty. No Nodes to search."
+
+        current = self.head
+        while current is not None:
+            if data in current.items:
+                return True
+            current = current.next
+        return False
+
+    def remove(self, data):
+        if self.head is None:
+            return "Empty List, No nodes to remove"
+
+        previous = None
+        current = self.head
+        while current is not None:
+            if data in current.items:
+                current.items.remove(data)
+                self._size -= 1
+                self._rebalance(previous, current)
+                return
+            previous = current
+            current = current.next
+        return "A node with that value is not present."
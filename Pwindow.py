@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""This is the sliding window aggregation file"""
+
+#Auther Name: Prathamesh Pawar
+#       Email: prathameshpawar1301@gmail.com
+
+"""Sliding-window aggregators that update incrementally instead of
+rescanning the window for every sample. Each window is bounded either by
+count (size=N keeps the last N values) or by time (span=S keeps the
+values stamped within the last S seconds). The count bound is kept as
+the maxlen attribute, since size() reports the current length. Time
+stamps default to clock(), which is time.monotonic() unless another
+clock is passed.
+
+- MinMaxWindow keeps two monotonic Deques of (stamp, value). A value that
+  can never become the window min (or max) again is dropped as soon as it
+  is pushed, so min() and max() just peek at the front.
+- SumWindow keeps the values in a Deque together with a running total, so
+  sum() and mean() are O(1).
+- MonoidWindow aggregates with any associative op(a, b) and its identity,
+  using two Pstacks. New values go on the back stack, which keeps a
+  running aggregate. Old values are evicted from the front stack, where
+  each entry stores the aggregate of itself and every newer entry below
+  it. When the front stack runs empty, the back stack is flipped into it.
+
+push and evict are amortized O(1) for all three. update_many(values)
+pushes a batch and accepts any iterable, including NumPy arrays, which
+are converted with tolist() so NumPy is never imported here. For a count
+window only the last `size` values of a batch are pushed, since the
+earlier ones would be evicted right away."""
+
+import time
+
+from Pdeque import Deque
+from Pstack import Pstack
+
+def _asList(values):
+    """Python list of values; NumPy arrays convert to Python scalars in one call"""
+    tolist = getattr(values, 'tolist', None)
+    return tolist() if tolist is not None else list(values)
+
+
+class _Window:
+
+    def __init__(self, size=None, span=None, clock=time.monotonic):
+        if (size is None) == (span is None):
+            raise ValueError("give exactly one of size= (count window) or span= (time window)")
+        if size is not None and size < 1:
+            raise ValueError("size must be at least 1")
+        self.maxlen = size
+        self.span = span
+        self.clock = clock
+        self._seq = 0
+
+    def push(self, value, timestamp=None):
+        """Add value to the window and evict whatever falls out of it"""
+        self._seq += 1
+        if self.span is None:
+            self._append(self._seq, value)
+            self._expire(self._seq - self.maxlen)
+        else:
+            stamp = self.clock() if timestamp is None else timestamp
+            self._append(stamp, value)
+            self._expire(stamp - self.span)
+
+    def update_many(self, values, timestamps=None):
+        """Push a batch; without timestamps a time window stamps it with one clock() read"""
+        values = _asList(values)
+        if timestamps is not None:
+            for value, stamp in zip(values, _asList(timestamps)):
+                self.push(value, stamp)
+        elif self.span is not None:
+            now = self.clock()
+            for value in values:
+                self.push(value, now)
+        else:
+            if len(values) > self.maxlen:
+                self._seq += len(values) - self.maxlen
+                values = values[-self.maxlen:]
+            for value in values:
+                self.push(value)
+
+    def evict(self, now=None):
+        """Drop values older than span as of now (time windows only)"""
+        if self.span is not None:
+            self._expire((self.clock() if now is None else now) - self.span)
+
+
+class MinMaxWindow(_Window):
+
+    def __init__(self, size=None, span=None, clock=time.monotonic):
+        super().__init__(size, span, clock)
+        self._mins = Deque()
+        self._maxs = Deque()
+
+    def __repr__(self):
+        return "MinMaxWindow(min={}, max={})".format(self.min(), self.max())
+
+    def _append(self, stamp, value):
+        mins, maxs = self._mins, self._maxs
+        while mins and mins.peekRear()[1] >= value:
+            mins.removeRear()
+        mins.addRear((stamp, value))
+        while maxs and maxs.peekRear()[1] <= value:
+            maxs.removeRear()
+        maxs.addRear((stamp, value))
+
+    def _expire(self, limit):
+        for monotonic in (self._mins, self._maxs):
+            while monotonic and monotonic.peekFront()[0] <= limit:
+                monotonic.removeFront()
+
+    def min(self):
+        if self._mins:
+            return self._mins.peekFront()[1]
+        return None
+
+    def max(self):
+        if self._maxs:
+            return self._maxs.peekFront()[1]
+        return None
+
+    def isEmpty(self):
+        return len(self._mins) == 0
+
+
+class SumWindow(_Window):
+
+    def __init__(self, size=None, span=None, clock=time.monotonic):
+        super().__init__(size, span, clock)
+        self._values = Deque()
+        self._total = 0
+
+    def __len__(self):
+        return len(self._values)
+
+    def __repr__(self):
+        return "SumWindow(count={}, sum={})".format(len(self._values), self._total)
+
+    def _append(self, stamp, value):
+        self._values.addRear((stamp, value))
+        self._total += value
+
+    def _expire(self, limit):
+        values = self._values
+        while values and values.peekFront()[0] <= limit:
+            self._total -= values.removeFront()[1]
+        if not values:
+            self._total = 0
+
+    def sum(self):
+        return self._total
+
+    def mean(self):
+        if self._values:
+            return self._total / len(self._values)
+        return None
+
+    def size(self):
+        return len(self._values)
+
+    def isEmpty(self):
+        return len(self._values) == 0
+
+
+class MonoidWindow(_Window):
+
+    def __init__(self, op, identity, size=None, span=None, clock=time.monotonic):
+        super().__init__(size, span, clock)
+        self.op = op
+        self.identity = identity
+        self._front = Pstack()
+        self._back = Pstack()
+        self._backAggregate = identity
+
+    def __len__(self):
+        return len(self._front) + len(self._back)
+
+    def __repr__(self):
+        return "MonoidWindow(count={}, value={})".format(len(self), self.query())
+
+    def _append(self, stamp, value):
+        self._back.push((stamp, value))
+        self._backAggregate = self.op(self._backAggregate, value)
+
+    def _flip(self):
+        """Move the back stack onto the front, newest first, so the oldest ends on top"""
+        op, aggregate = self.op, self.identity
+        for stamp, value in reversed(self._back.items):
+            aggregate = op(value, aggregate)
+            self._front.push((stamp, aggregate))
+        self._back = Pstack()
+        self._backAggregate = self.identity
+
+    def _expire(self, limit):
+        while len(self):
+            if not self._front:
+                self._flip()
+            if self._front.peek()[0] > limit:
+                return
+            self._front.pop()
+
+    def query(self):
+        """op applied across the window, oldest value first"""
+        if self._front:
+            return self.op(self._front.peek()[1], self._backAggregate)
+        return self._backAggregate
+
+    def size(self):
+        return len(self)
+
+    def isEmpty(self):
+        return len(self) == 0
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""This is the work-stealing deque and scheduler file"""
+
+#Auther Name: Prathamesh Pawar
+#       Email: prathameshpawar1301@gmail.com
+
+"""WorkStealingDeque is a Deque with one owner and any number of thieves.
+The owner calls push and pop, which work at the rear (LIFO), so the most
+recently split, cache-warm task runs next. Thieves call steal (or
+steal_many), which take from the front (FIFO): that is the oldest task,
+which for divide-and-conquer work is usually the largest. Each deque has
+its own lock, so workers only contend when they touch the same deque.
+
+WorkStealingPool runs one thread per worker, each owning a
+WorkStealingDeque. A task submitted from inside a worker goes onto that
+worker's own deque. A task submitted from outside is spread round-robin.
+An idle worker steals from the other deques, starting at a random
+victim, and sleeps only when every deque is empty. join(future), called
+inside a task, keeps running other tasks until the future is done, so
+recursive jobs can wait on their subtasks without tying up a worker."""
+
+import concurrent.futures
+import os
+import random
+import threading
+from concurrent.futures import Future
+
+from Pdeque import Deque
+
+IDLE_TIMEOUT = 0.05
+
+class WorkStealingDeque(Deque):
+
+    def __init__(self):
+        super().__init__()
+        self._lock = threading.Lock()
+
+    def push(self, item):
+        with self._lock:
+            self.addRear(item)
+
+    def pop(self):
+        """Owner end: newest item, or None when empty"""
+        with self._lock:
+            return self.removeRear()
+
+    def steal(self):
+        """Thief end: oldest item, or None when empty"""
+        with self._lock:
+            return self.removeFront()
+
+    def steal_many(self, n=None):
+        """Steal up to n of the oldest items (half the deque by default)"""
+        with self._lock:
+            if n is None:
+                n = (len(self) + 1) // 2
+            return self.drain(n)
+
+
+class WorkStealingPool:
+
+    def __init__(self, workers=None):
+        workers = workers or os.cpu_count() or 1
+        self._deques = [WorkStealingDeque() for _ in range(workers)]
+        self._steals = [0] * workers
+        self._local = threading.local()
+        self._wake = threading.Condition()
+        self._idle = 0
+        self._next = 0
+        self._shutdown = False
+        self._threads = [threading.Thread(target=self._worker, args=(index,), daemon=True)
+                         for index in range(workers)]
+        for thread in self._threads:
+            thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+
+    def __repr__(self):
+        return "WorkStealingPool(workers={})".format(len(self._deques))
+
+    def submit(self, fn, *args, **kwargs):
+        """Queue fn(*args, **kwargs); running tasks may still submit subtasks after shutdown"""
+        index = getattr(self._local, 'index', None)
+        if index is None and self._shutdown:
+            raise RuntimeError("cannot submit after shutdown")
+        future = Future()
+        if index is None:
+            index = self._next
+            self._next = (index + 1) % len(self._deques)
+        self._deques[index].push((future, fn, args, kwargs))
+        if self._idle:
+            with self._wake:
+                self._wake.notify()
+        return future
+
+    def _find(self, index):
+        """Pop from the worker's own deque, else steal from the others"""
+        if index is not None:
+            task = self._deques[index].pop()
+            if task is not None:
+                return task
+        count = len(self._deques)
+        start = random.randrange(count)
+        for offset in range(count):
+            victim = (start + offset) % count
+            if victim != index:
+                task = self._deques[victim].steal()
+                if task is not None:
+                    if index is not None:
+                        self._steals[index] += 1
+                    return task
+        return None
+
+    def _run(self, task):
+        future, fn, args, kwargs = task
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as exc:
+            future.set_exception(exc)
+        else:
+            future.set_result(result)
+
+    def _worker(self, index):
+        self._local.index = index
+        while True:
+            task = self._find(index)
+            if task is not None:
+                self._run(task)
+                continue
+            with self._wake:
+                if self._shutdown and not any(self._deques):
+                    return
+                self._idle += 1
+                self._wake.wait(IDLE_TIMEOUT)
+                self._idle -= 1
+
+    def join(self, future):
+        """Return future's result; inside a worker, run other tasks while waiting"""
+        index = getattr(self._local, 'index', None)
+        if index is None:
+            return future.result()
+        while not future.done():
+            task = self._find(index)
+            if task is not None:
+                self._run(task)
+            else:
+                concurrent.futures.wait([future], timeout=IDLE_TIMEOUT / 50)
+        return future.result()
+
+    def map(self, fn, iterable):
+        futures = [self.submit(fn, item) for item in iterable]
+        return [self.join(future) for future in futures]
+
+    def shutdown(self, wait=True):
+        """Stop accepting tasks; workers exit once every deque has drained"""
+        with self._wake:
+            self._shutdown = True
+            self._wake.notify_all()
+        if wait:
+            for thread in self._threads:
+                if thread is not threading.current_thread():
+                    thread.join()
+
+    def stats(self):
+        return {
+            'workers': len(self._deques),
+            'steals': sum(self._steals),
+            'queued': sum(len(deque) for deque in self._deques),
+        }
@@ -0,0 +1,10 @@
+#!/usr/bin/env python3
+"""
+Benchmarks Package - Performance measurements for the core data structures
+
+Run a benchmark from the repository root, e.g.:
+    python -m benchmarks.queue_bench
+"""
+
+# Author Name: Prathamesh Pawar
+# Email: prathameshpawar1301@gmail.com
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Async Queue Benchmark - AsyncQueue/AsyncDeque vs busy-polling Queue/Deque
+"""
+
+# Author Name: Prathamesh Pawar
+# Email: prathameshpawar1301@gmail.com
+
+import asyncio
+import time
+
+from Pqueue import Queue
+from Pdeque import Deque
+from Pasyncqueue import AsyncQueue, AsyncDeque
+
+ITEMS = 200000
+MAXSIZE = 1024
+BATCH = 64
+
+
+async def awaited(queue, batched, items=ITEMS):
+    async def produce():
+        for i in range(items):
+            await queue.put(i)
+
+    async def consume():
+        received = 0
+        while received < items:
+            if batched:
+                received += len(await queue.get_many(BATCH))
+            else:
+                await queue.get()
+                received += 1
+
+    await asyncio.gather(produce(), consume())
+
+
+async def polled(queue, push, pop, items=ITEMS):
+    """The pre-async pattern: spin with sleep(0) while full/empty; returns idle spins"""
+    spins = 0
+
+    async def produce():
+        nonlocal spins
+        for i in range(items):
+            while queue.size() >= MAXSIZE:
+                spins += 1
+                await asyncio.sleep(0)
+            push(i)
+
+    async def consume():
+        nonlocal spins
+        received = 0
+        while received < items:
+            while queue.isEmpty():
+                spins += 1
+                await asyncio.sleep(0)
+            pop()
+            received += 1
+
+    await asyncio.gather(produce(), consume())
+    return spins
+
+
+def timed(coro):
+    start = time.perf_counter()
+    result = asyncio.run(coro)
+    return ITEMS / (time.perf_counter() - start), result
+
+
+def main():
+    print("=== Async Queue Benchmark (items/sec) ===")
+    rows = []
+    queue = Queue()
+    rows.append(("Queue busy-poll",) + timed(polled(queue, queue.enqueue, queue.dequeue)))
+    deque = Deque()
+    rows.append(("Deque busy-poll",) + timed(polled(deque, deque.addRear, deque.removeFront)))
+    rows.append(("AsyncQueue put/get",) + timed(awaited(AsyncQueue(MAXSIZE), False)))
+    rows.append(("AsyncQueue get_many",) + timed(awaited(AsyncQueue(MAXSIZE), True)))
+    rows.append(("AsyncDeque put/get",) + timed(awaited(AsyncDeque(MAXSIZE), False)))
+    rows.append(("AsyncDeque get_many",) + timed(awaited(AsyncDeque(MAXSIZE), True)))
+    for name, rate, spins in rows:
+        idle = "" if spins is None else f"  ({spins} idle spins)"
+        print(f"{name:>22} {rate:>12.0f}{idle}")
+
+
+if __name__ == "__main__":
+    main()
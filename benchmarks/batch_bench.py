@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Batch Benchmark - per-item vs batched transfers for Pstack, Queue and Deque
+"""
+
+# Author Name: Prathamesh Pawar
+# Email: prathameshpawar1301@gmail.com
+
+import time
+
+from Pstack import Pstack
+from Pqueue import Queue
+from Pdeque import Deque
+
+ITEMS = 10 ** 6
+BATCH = 1000
+
+
+def rate(func, items=ITEMS):
+    start = time.perf_counter()
+    func()
+    return items / (time.perf_counter() - start)
+
+
+def stack_single():
+    stack = Pstack()
+    for i in range(ITEMS):
+        stack.push(i)
+    for _ in range(ITEMS):
+        stack.pop()
+
+
+def stack_batched():
+    stack = Pstack()
+    data = range(BATCH)
+    for _ in range(ITEMS // BATCH):
+        stack.push_many(data)
+    for _ in range(ITEMS // BATCH):
+        stack.pop_many(BATCH)
+
+
+def queue_single():
+    queue = Queue()
+    for i in range(ITEMS):
+        queue.enqueue(i)
+    for _ in range(ITEMS):
+        queue.dequeue()
+
+
+def queue_batched():
+    queue = Queue()
+    data = range(BATCH)
+    for _ in range(ITEMS // BATCH):
+        queue.enqueue_many(data)
+    for _ in range(ITEMS // BATCH):
+        queue.dequeue_many(BATCH)
+
+
+def deque_single():
+    deque = Deque()
+    for i in range(ITEMS // 2):
+        deque.addRear(i)
+        deque.addFront(i)
+    for _ in range(ITEMS):
+        deque.removeFront()
+
+
+def deque_batched():
+    deque = Deque()
+    data = range(BATCH)
+    for _ in range(ITEMS // BATCH // 2):
+        deque.extend_rear(data)
+        deque.extend_front(data)
+    for _ in range(ITEMS // BATCH):
+        deque.drain(BATCH)
+
+
+CASES = [
+    ("Pstack push/pop", stack_single, "push_many/pop_many", stack_batched),
+    ("Queue enqueue/dequeue", queue_single, "enqueue_many/dequeue_many", queue_batched),
+    ("Deque add*/removeFront", deque_single, "extend_*/drain", deque_batched),
+]
+
+
+def main():
+    print(f"=== Batch Benchmark ({ITEMS} items in and out, batch={BATCH}, items/sec) ===")
+    for single_name, single, batched_name, batched in CASES:
+        single_rate = rate(single)
+        batched_rate = rate(batched)
+        print(f"{single_name:>24} {single_rate:>12.0f}   {batched_name:>26} {batched_rate:>12.0f}"
+              f"   x{batched_rate / single_rate:.1f}")
+
+
+if __name__ == "__main__":
+    main()
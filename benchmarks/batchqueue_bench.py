@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Batch Queue Benchmark - throughput, fill ratio and flush latency of BatchQueue settings vs per-item delivery
+"""
+
+# Author Name: Prathamesh Pawar
+# Email: prathameshpawar1301@gmail.com
+
+import threading
+import time
+
+from Pbatchqueue import BatchQueue
+from Pblockingqueue import BlockingQueue
+
+ITEMS = 20000
+PRODUCERS = 4
+SINK_COST = 0.0002     # fixed seconds per sink write, like a syscall or a network round trip
+SETTINGS = [(10, 0.001), (100, 0.001), (100, 0.01), (1000, 0.01)]
+
+
+def sink(batch):
+    time.sleep(SINK_COST)
+
+
+def produce(queue, count):
+    for i in range(count):
+        queue.put(i)
+
+
+def per_item():
+    queue = BlockingQueue()
+    per_producer = ITEMS // PRODUCERS
+    producers = [threading.Thread(target=produce, args=(queue, per_producer)) for _ in range(PRODUCERS)]
+    start = time.perf_counter()
+    for thread in producers:
+        thread.start()
+    for _ in range(per_producer * PRODUCERS):
+        sink([queue.get()])
+    for thread in producers:
+        thread.join()
+    return time.perf_counter() - start
+
+
+def batched(max_items, max_delay):
+    queue = BatchQueue(max_items=max_items, max_delay=max_delay)
+    per_producer = ITEMS // PRODUCERS
+    producers = [threading.Thread(target=produce, args=(queue, per_producer)) for _ in range(PRODUCERS)]
+    start = time.perf_counter()
+    for thread in producers:
+        thread.start()
+    received = 0
+    while received < per_producer * PRODUCERS:
+        batch = queue.get_batch()
+        sink(batch)
+        received += len(batch)
+    for thread in producers:
+        thread.join()
+    return time.perf_counter() - start, queue.stats()
+
+
+def main():
+    print(f"=== Batch Queue Benchmark ({ITEMS} items, {PRODUCERS} producers, {SINK_COST * 1e6:.0f} us per sink write) ===")
+    print(f"{'setting':>18} {'items/s':>10} {'batches':>8} {'fill':>6} {'mean ms':>8} {'max ms':>8}")
+    elapsed = per_item()
+    print(f"{'per item':>18} {ITEMS / elapsed:>10.0f} {ITEMS:>8} {'':>6} {'':>8} {'':>8}")
+    for max_items, max_delay in SETTINGS:
+        elapsed, stats = batched(max_items, max_delay)
+        setting = f"{max_items}/{max_delay * 1e3:g}ms"
+        print(f"{setting:>18} {ITEMS / elapsed:>10.0f} {stats['batches']:>8} {stats['fill_ratio']:>6.2f} "
+              f"{stats['mean_latency'] * 1e3:>8.2f} {stats['max_latency'] * 1e3:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Blocking Queue Benchmark - producer/consumer throughput by thread count
+"""
+
+# Author Name: Prathamesh Pawar
+# Email: prathameshpawar1301@gmail.com
+
+import threading
+import time
+
+from Pblockingqueue import BlockingQueue
+
+THREADS = [1, 4, 16]
+ITEMS = 200000
+MAXSIZE = 1024
+BATCH = 64
+
+
+def run(threads, batched, items=ITEMS):
+    """Run `threads` producers and `threads` consumers; return items/sec"""
+    queue = BlockingQueue(maxsize=MAXSIZE)
+    per_producer = items // threads
+    stop = object()
+
+    def produce():
+        if batched:
+            for start in range(0, per_producer, BATCH):
+                queue.put_many(range(start, min(start + BATCH, per_producer)))
+        else:
+            for i in range(per_producer):
+                queue.put(i)
+
+    def consume():
+        while True:
+            batch = queue.get_many(BATCH) if batched else [queue.get()]
+            stops = batch.count(stop)
+            if stops:
+                # a batch may carry other consumers' sentinels; hand them back
+                for _ in range(stops - 1):
+                    queue.put(stop)
+                return
+
+    producers = [threading.Thread(target=produce) for _ in range(threads)]
+    consumers = [threading.Thread(target=consume) for _ in range(threads)]
+    start = time.perf_counter()
+    for thread in producers + consumers:
+        thread.start()
+    for thread in producers:
+        thread.join()
+    for _ in consumers:
+        queue.put(stop)
+    for thread in consumers:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    return per_producer * threads / elapsed
+
+
+def main():
+    print("=== Blocking Queue Benchmark (items/sec) ===")
+    print(f"{'threads':>8} {'put/get':>12} {'put_many/get_many':>18}")
+    for threads in THREADS:
+        print(f"{threads:>8} {run(threads, False):>12.0f} {run(threads, True):>18.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Cursor List Benchmark - array backed CursorLL vs object based SLL/DLL
+"""
+
+# Author Name: Prathamesh Pawar
+# Email: prathameshpawar1301@gmail.com
+
+import gc
+import time
+import tracemalloc
+
+from Psll import SLL
+from Pdll import DLL
+from Pcursorll import CursorLL
+
+SIZE = 10 ** 6
+
+CANDIDATES = [
+    ("SLL", SLL),
+    ("DLL", DLL),
+    ("CursorLL", CursorLL),
+    ("CursorLL[q]", lambda: CursorLL(typecode='q')),
+]
+
+
+def timed(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def bytes_per_element(factory, size=SIZE):
+    tracemalloc.start()
+    container = factory()
+    for i in range(size):
+        container.addRear(i)
+    nbytes = tracemalloc.get_traced_memory()[0] / size
+    tracemalloc.stop()
+    return nbytes
+
+
+def run(factory, size=SIZE):
+    """Return (insert s, traverse s, remove s, gc collect s)"""
+    container = factory()
+    add = container.addRear
+    insert = timed(lambda: [add(i) for i in range(size)])
+    collect = timed(gc.collect)
+    traverse = timed(lambda: sum(container))
+    pop = container.popFront
+    remove = timed(lambda: [pop() for _ in range(size)])
+    return insert, traverse, remove, collect
+
+
+def main():
+    print(f"=== Linked List Engine Benchmark ({SIZE} elements) ===")
+    print(f"{'engine':>12} {'insert s':>9} {'traverse s':>11} {'remove s':>9} {'B/elem':>8} {'gc s':>7}")
+    for name, factory in CANDIDATES:
+        insert, traverse, remove, collect = run(factory)
+        nbytes = bytes_per_element(factory)
+        print(f"{name:>12} {insert:>9.3f} {traverse:>11.3f} {remove:>9.3f} {nbytes:>8.1f} {collect:>7.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Deque Benchmark - end operations, indexed access and memory per item
+"""
+
+# Author Name: Prathamesh Pawar
+# Email: prathameshpawar1301@gmail.com
+
+import time
+import tracemalloc
+
+from Pdeque import Deque
+from Pdll import DLL
+
+SIZES = [10 ** 4, 10 ** 5, 10 ** 6]
+OPS = 200000
+LOOKUPS = 2000
+
+
+def end_ops_ns(size, ops=OPS):
+    """Time addFront/removeFront and addRear/removeRear pairs at a given size"""
+    deque = Deque()
+    for i in range(size):
+        deque.addRear(i)
+
+    start = time.perf_counter()
+    for i in range(ops):
+        deque.addFront(i)
+        deque.removeRear()
+        deque.addRear(i)
+        deque.removeFront()
+    elapsed = time.perf_counter() - start
+    return elapsed * 1e9 / (4 * ops)
+
+
+def index_ns(size, lookups=LOOKUPS):
+    """Time indexed reads spread across the whole deque"""
+    deque = Deque()
+    for i in range(size):
+        deque.addRear(i)
+    step = max(1, size // lookups)
+
+    start = time.perf_counter()
+    for i in range(0, size, step):
+        deque[i]
+    elapsed = time.perf_counter() - start
+    return elapsed * 1e9 / len(range(0, size, step))
+
+
+def bytes_per_item(factory, add, size):
+    """Measure allocated bytes per stored item with tracemalloc"""
+    tracemalloc.start()
+    container = factory()
+    for i in range(size):
+        add(container, i)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current / size
+
+
+def main():
+    print("=== Deque Benchmark ===")
+    print(f"{'size':>10} {'end op ns':>10} {'index ns':>10} {'Deque B/item':>13} {'DLL B/item':>11}")
+    for size in SIZES:
+        deque_bytes = bytes_per_item(Deque, Deque.addRear, size)
+        dll_bytes = bytes_per_item(DLL, DLL.addFront, size)
+        print(f"{size:>10} {end_ops_ns(size):>10.1f} {index_ns(size):>10.1f} "
+              f"{deque_bytes:>13.1f} {dll_bytes:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Linked Sort Benchmark - in-place SLL/DLL merge sort vs copying to a list, sorting and rebuilding
+"""
+
+# Author Name: Prathamesh Pawar
+# Email: prathameshpawar1301@gmail.com
+
+import random
+import time
+import tracemalloc
+
+from Pdll import DLL
+from Psll import SLL
+
+SIZES = [10 ** 4, 10 ** 5, 4 * 10 ** 5]
+
+
+def build(cls, values):
+    linked = cls()
+    for value in values:
+        linked.addRear(value)
+    return linked
+
+
+def copy_sort(linked):
+    """The old workaround: list(), sorted() and a fresh list of new nodes"""
+    rebuilt = type(linked)()
+    for value in sorted(linked):
+        rebuilt.addRear(value)
+    return rebuilt
+
+
+def in_place(linked):
+    linked.sort()
+    return linked
+
+
+def measure(cls, values, sort):
+    linked = build(cls, values)
+    start = time.perf_counter()
+    sort(linked)
+    elapsed = time.perf_counter() - start
+
+    linked = build(cls, values)
+    tracemalloc.start()
+    sort(linked)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 2 ** 20
+
+
+def main():
+    rng = random.Random(7)
+    print("=== Linked Sort Benchmark (seconds / peak extra MiB) ===")
+    print(f"{'size':>8} {'list':>5} {'copy+sort':>10} {'MiB':>8} {'in place':>10} {'MiB':>8}")
+    for size in SIZES:
+        values = [rng.random() for _ in range(size)]
+        for cls in (SLL, DLL):
+            copy_time, copy_peak = measure(cls, values, copy_sort)
+            own_time, own_peak = measure(cls, values, in_place)
+            print(f"{size:>8} {cls.__name__:>5} {copy_time:>10.4f} {copy_peak:>8.2f} "
+                  f"{own_time:>10.4f} {own_peak:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+LRU Cache Benchmark - LRUCache/memoize vs functools.lru_cache
+"""
+
+# Author Name: Prathamesh Pawar
+# Email: prathameshpawar1301@gmail.com
+
+import functools
+import random
+import time
+
+from Plru import LRUCache, memoize
+
+CALLS = 500000
+MAXSIZE = 1024
+TRACES = [
+    ("hit-heavy", 512),       # key space fits in the cache
+    ("mixed", 2048),
+    ("miss-heavy", 10 ** 6),  # almost every key is new
+]
+
+
+def trace(key_space, calls=CALLS, seed=13):
+    rng = random.Random(seed)
+    return [rng.randrange(key_space) for _ in range(calls)]
+
+
+def ops_per_sec(func, keys):
+    start = time.perf_counter()
+    for key in keys:
+        func(key)
+    return len(keys) / (time.perf_counter() - start)
+
+
+def raw_cache(keys):
+    cache = LRUCache(MAXSIZE)
+    get, put = cache.get, cache.put
+
+    def lookup(key):
+        value = get(key)
+        if value is None:
+            put(key, key)
+
+    return ops_per_sec(lookup, keys), cache.stats()
+
+
+def main():
+    print(f"=== LRU Cache Benchmark ({CALLS} calls, maxsize={MAXSIZE}, calls/sec) ===")
+    print(f"{'trace':>11} {'lru_cache':>11} {'memoize':>10} {'LRUCache':>10} {'hit ratio':>10}")
+    for name, key_space in TRACES:
+        keys = trace(key_space)
+        stdlib = ops_per_sec(functools.lru_cache(MAXSIZE)(lambda key: key), keys)
+        ours = ops_per_sec(memoize(MAXSIZE)(lambda key: key), keys)
+        raw, stats = raw_cache(keys)
+        ratio = stats['hits'] / (stats['hits'] + stats['misses'])
+        print(f"{name:>11} {stdlib:>11.0f} {ours:>10.0f} {raw:>10.0f} {ratio:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Linked List Memory Benchmark - bytes per element for SLL and DLL
+"""
+
+# Author Name: Prathamesh Pawar
+# Email: prathameshpawar1301@gmail.com
+
+import tracemalloc
+
+from Psll import SLL
+from Pdll import DLL
+
+SIZES = [10 ** 4, 10 ** 5, 10 ** 6]
+
+
+class DictNode:
+    """Reference node without __slots__, shaped like the original Pnode.Node"""
+
+    def __init__(self, data=None):
+        self.data = data
+        self.next = None
+        self.prev = None
+
+
+def dict_chain(size):
+    head = None
+    for _ in range(size):
+        node = DictNode()
+        node.next = head
+        head = node
+    return head
+
+
+def fill(factory, size):
+    container = factory()
+    for _ in range(size):
+        container.addFront(None)
+    return container
+
+
+def bytes_per_element(build, size):
+    """Allocated bytes per element; payloads are all None so only node overhead counts"""
+    tracemalloc.start()
+    container = build(size)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del container
+    return current / size
+
+
+def main():
+    print("=== Linked List Memory Benchmark (bytes per element) ===")
+    print(f"{'size':>10} {'SLL':>8} {'DLL':>8} {'dict Node':>10}")
+    for size in SIZES:
+        sll = bytes_per_element(lambda n: fill(SLL, n), size)
+        dll = bytes_per_element(lambda n: fill(DLL, n), size)
+        ref = bytes_per_element(dict_chain, size)
+        print(f"{size:>10} {sll:>8.1f} {dll:>8.1f} {ref:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Node Pool Benchmark - insert/remove churn with and without a NodePool:
+time per operation, garbage collections run, and allocations per insert
+"""
+
+# Author Name: Prathamesh Pawar
+# Email: prathameshpawar1301@gmail.com
+
+import gc
+import time
+import tracemalloc
+
+from Pnode import SNode, DNode
+from Pnodepool import NodePool
+from Psll import SLL
+from Pdll import DLL
+
+LIVE = 10000
+ROUNDS = 50
+
+
+def collections():
+    return sum(generation['collections'] for generation in gc.get_stats())
+
+
+def churn(container, live=LIVE, rounds=ROUNDS):
+    """Keep `live` items, repeatedly draining and refilling them;
+    returns (ns per insert/remove, garbage collections run)"""
+    for _ in range(live):
+        container.addRear(None)
+    before = collections()
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for _ in range(live):
+            container.popFront()
+        for _ in range(live):
+            container.addRear(None)
+    elapsed = time.perf_counter() - start
+    return elapsed * 1e9 / (2 * live * rounds), collections() - before
+
+
+def allocations(container, live=LIVE, rounds=ROUNDS):
+    """Memory blocks and bytes allocated per insert while refilling, traced
+    separately so tracemalloc does not skew the timings; payloads are None
+    so only the nodes count"""
+    for _ in range(live):
+        container.addRear(None)
+    blocks = size = 0
+    for _ in range(rounds):
+        for _ in range(live):
+            container.popFront()
+        tracemalloc.start()
+        for _ in range(live):
+            container.addRear(None)
+        traces = tracemalloc.take_snapshot().traces
+        tracemalloc.stop()
+        blocks += len(traces)
+        size += sum(trace.size for trace in traces)
+    return blocks / (live * rounds), size / (live * rounds)
+
+
+def main():
+    print(f"=== Node Pool Benchmark ({LIVE} live items, {ROUNDS} drain/refill rounds) ===")
+    print(f"{'list':>6} {'pool':>5} {'ns/op':>8} {'gc runs':>8} {'blocks/insert':>14} {'bytes/insert':>13}")
+    for name, cls, node_class in (("SLL", SLL, SNode), ("DLL", DLL, DNode)):
+        for pooled in (False, True):
+            def build():
+                return cls(pool=NodePool(node_class, cap=LIVE)) if pooled else cls()
+            ns, runs = churn(build())
+            blocks, size = allocations(build())
+            print(f"{name:>6} {'yes' if pooled else 'no':>5} {ns:>8.1f} {runs:>8} {blocks:>14.2f} {size:>13.1f}")
+
+
+if __name__ == "__main__":
+    main()
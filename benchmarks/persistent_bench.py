@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Persistent Benchmark - snapshot-per-operation cost of copying Pstack/Queue vs persistent versions
+"""
+
+# Author Name: Prathamesh Pawar
+# Email: prathameshpawar1301@gmail.com
+
+import time
+
+from Ppersistent import PersistentQueue, PersistentStack
+from Pqueue import Queue
+from Pstack import Pstack
+
+DEPTHS = [10 ** 2, 10 ** 3, 10 ** 4]
+OPS = 5000
+
+
+def copied_stack(depth):
+    stack = Pstack()
+    stack.push_many(range(depth))
+    snapshots = []
+    start = time.perf_counter()
+    for i in range(OPS):
+        stack.push(i)
+        snapshots.append(list(stack.items))
+        stack.pop()
+    return time.perf_counter() - start
+
+
+def persistent_stack(depth):
+    stack = PersistentStack(range(depth))
+    snapshots = []
+    start = time.perf_counter()
+    for i in range(OPS):
+        snapshots.append(stack.push(i))
+    return time.perf_counter() - start
+
+
+def copied_queue(depth):
+    queue = Queue()
+    queue.enqueue_many(range(depth))
+    snapshots = []
+    start = time.perf_counter()
+    for i in range(OPS):
+        queue.enqueue(i)
+        queue.dequeue()
+        snapshots.append(list(queue))
+    return time.perf_counter() - start
+
+
+def persistent_queue(depth):
+    queue = PersistentQueue(range(depth))
+    snapshots = []
+    start = time.perf_counter()
+    for i in range(OPS):
+        queue = queue.enqueue(i).dequeue()
+        snapshots.append(queue)
+    return time.perf_counter() - start
+
+
+def main():
+    print(f"=== Persistent Benchmark ({OPS} operations, one snapshot each, seconds) ===")
+    print(f"{'depth':>8} {'Pstack copy':>12} {'Persistent':>11} {'Queue copy':>11} {'Persistent':>11}")
+    for depth in DEPTHS:
+        print(f"{depth:>8} {copied_stack(depth):>12.4f} {persistent_stack(depth):>11.4f} "
+              f"{copied_queue(depth):>11.4f} {persistent_queue(depth):>11.4f}")
+
+
+if __name__ == "__main__":
+    main()
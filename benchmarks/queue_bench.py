@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Queue Benchmark - per-operation latency as queue depth grows
+"""
+
+# Author Name: Prathamesh Pawar
+# Email: prathameshpawar1301@gmail.com
+
+import time
+
+from Pqueue import Queue
+
+DEPTHS = [10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6]
+OPS = 200000
+
+
+def steady_state_ns(depth, ops=OPS):
+    """Fill a queue to `depth`, then time enqueue+dequeue pairs at that depth"""
+    queue = Queue()
+    for i in range(depth):
+        queue.enqueue(i)
+
+    start = time.perf_counter()
+    for i in range(ops):
+        queue.enqueue(i)
+        queue.dequeue()
+    elapsed = time.perf_counter() - start
+    return elapsed * 1e9 / (2 * ops)
+
+
+def fill_drain_ns(depth):
+    """Time filling a fresh queue to `depth` and draining it again"""
+    queue = Queue()
+    start = time.perf_counter()
+    for i in range(depth):
+        queue.enqueue(i)
+    while not queue.isEmpty():
+        queue.dequeue()
+    elapsed = time.perf_counter() - start
+    return elapsed * 1e9 / (2 * depth)
+
+
+def main():
+    print("=== Queue Benchmark (ns per op) ===")
+    print(f"{'depth':>10} {'steady':>10} {'fill+drain':>12}")
+    for depth in DEPTHS:
+        print(f"{depth:>10} {steady_state_ns(depth):>10.1f} {fill_drain_ns(depth):>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
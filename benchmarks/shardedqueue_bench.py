@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Sharded Queue Benchmark - MPMC throughput of ShardedQueue vs one locked BlockingQueue across thread counts
+"""
+
+# Author Name: Prathamesh Pawar
+# Email: prathameshpawar1301@gmail.com
+
+import threading
+import time
+
+from Pblockingqueue import BlockingQueue
+from Pshardedqueue import ShardedQueue
+
+THREADS = [1, 2, 4, 8, 16]
+ITEMS = 80000
+
+
+def run(queue, pairs):
+    """pairs producers and pairs consumers move ITEMS items in total; returns items per second"""
+    per_producer = ITEMS // pairs
+    remaining = [per_producer * pairs]
+    counter = threading.Lock()
+
+    def produce():
+        for i in range(per_producer):
+            queue.put(i)
+
+    def consume():
+        while True:
+            item = queue.get(timeout=0.2)
+            if item is None:
+                return
+            with counter:
+                remaining[0] -= 1
+
+    threads = [threading.Thread(target=produce) for _ in range(pairs)]
+    threads += [threading.Thread(target=consume) for _ in range(pairs)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    while remaining[0]:
+        time.sleep(0.001)
+    elapsed = time.perf_counter() - start
+    for thread in threads:
+        thread.join()
+    return per_producer * pairs / elapsed
+
+
+def main():
+    print(f"=== Sharded Queue Benchmark ({ITEMS} items, items/sec) ===")
+    print(f"{'pairs':>6} {'BlockingQueue':>14} {'round_robin':>12} {'hash':>10}")
+    for pairs in THREADS:
+        single = run(BlockingQueue(), pairs)
+        round_robin = run(ShardedQueue(policy='round_robin'), pairs)
+        hashed = run(ShardedQueue(policy='hash'), pairs)
+        print(f"{pairs:>6} {single:>14.0f} {round_robin:>12.0f} {hashed:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
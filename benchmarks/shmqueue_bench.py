@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Shared Memory Queue Benchmark - messages/sec vs multiprocessing.Queue
+"""
+
+# Author Name: Prathamesh Pawar
+# Email: prathameshpawar1301@gmail.com
+
+import multiprocessing
+import time
+
+from Pshmqueue import SharedMemoryQueue
+
+MESSAGES = 200000
+PAYLOAD = b'x' * 100
+
+
+def shm_producer(queue, count):
+    for _ in range(count):
+        while not queue.enqueue(PAYLOAD):
+            pass
+
+
+def mp_producer(queue, count):
+    for _ in range(count):
+        queue.put(PAYLOAD)
+
+
+def run_shm(mode, producers, messages=MESSAGES):
+    queue = SharedMemoryQueue(slots=4096, slot_size=128, mode=mode)
+    per_producer = messages // producers
+    procs = [multiprocessing.Process(target=shm_producer, args=(queue, per_producer))
+             for _ in range(producers)]
+    start = time.perf_counter()
+    for proc in procs:
+        proc.start()
+    received = 0
+    while received < per_producer * producers:
+        if queue.dequeue() is not None:
+            received += 1
+    elapsed = time.perf_counter() - start
+    for proc in procs:
+        proc.join()
+    queue.close()
+    queue.unlink()
+    return received / elapsed
+
+
+def run_mp(producers, messages=MESSAGES):
+    queue = multiprocessing.Queue(maxsize=4096)
+    per_producer = messages // producers
+    procs = [multiprocessing.Process(target=mp_producer, args=(queue, per_producer))
+             for _ in range(producers)]
+    start = time.perf_counter()
+    for proc in procs:
+        proc.start()
+    for _ in range(per_producer * producers):
+        queue.get()
+    elapsed = time.perf_counter() - start
+    for proc in procs:
+        proc.join()
+    return per_producer * producers / elapsed
+
+
+def main():
+    print(f"=== Shared Memory Queue Benchmark ({len(PAYLOAD)}-byte messages/sec) ===")
+    print(f"{'setup':>28} {'msgs/sec':>12}")
+    print(f"{'SharedMemoryQueue spsc, 1P':>28} {run_shm('spsc', 1):>12.0f}")
+    print(f"{'multiprocessing.Queue, 1P':>28} {run_mp(1):>12.0f}")
+    print(f"{'SharedMemoryQueue mpmc, 4P':>28} {run_shm('mpmc', 4):>12.0f}")
+    print(f"{'multiprocessing.Queue, 4P':>28} {run_mp(4):>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Skip List Benchmark - insert, lookup, delete and rank of SkipList vs a bisect-sorted list
+"""
+
+# Author Name: Prathamesh Pawar
+# Email: prathameshpawar1301@gmail.com
+
+import bisect
+import random
+import time
+
+from Pskiplist import SkipList
+
+SIZES = [10 ** 4, 10 ** 5]
+LOOKUPS = 10000
+
+
+def timed(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def sorted_insert(keys, key):
+    index = bisect.bisect_left(keys, key)
+    if index == len(keys) or keys[index] != key:
+        keys.insert(index, key)
+
+
+def sorted_remove(keys, key):
+    index = bisect.bisect_left(keys, key)
+    if index < len(keys) and keys[index] == key:
+        del keys[index]
+
+
+def sorted_contains(keys, key):
+    index = bisect.bisect_left(keys, key)
+    return index < len(keys) and keys[index] == key
+
+
+def run(size, rng):
+    inserts = rng.sample(range(size * 4), size)
+    lookups = [rng.choice(inserts) for _ in range(LOOKUPS)]
+    deletes = inserts[:size // 2]
+
+    plain = []
+    skip = SkipList(seed=1)
+    ranked = SkipList(indexable=True, seed=1)
+
+    results = {}
+    results['sorted list'] = (
+        timed(lambda: [sorted_insert(plain, k) for k in inserts]),
+        timed(lambda: [sorted_contains(plain, k) for k in lookups]),
+        timed(lambda: [bisect.bisect_left(plain, k) for k in lookups]),
+        timed(lambda: [sorted_remove(plain, k) for k in deletes]),
+    )
+    for name, sl in (('SkipList', skip), ('indexable', ranked)):
+        results[name] = (
+            timed(lambda: [sl.insert(k) for k in inserts]),
+            timed(lambda: [sl.search(k) for k in lookups]),
+            timed(lambda: [sl.rank(k) for k in lookups]) if sl.indexable else None,
+            timed(lambda: [sl.remove(k) for k in deletes]),
+        )
+    return results
+
+
+def main():
+    rng = random.Random(7)
+    print(f"=== Skip List Benchmark ({LOOKUPS} lookups, seconds) ===")
+    print(f"{'size':>8} {'structure':>12} {'inserts':>9} {'lookups':>9} {'rank':>9} {'deletes':>9}")
+    for size in SIZES:
+        for name, (inserts, lookups, ranks, deletes) in run(size, rng).items():
+            rank = "n/a" if ranks is None else f"{ranks:.4f}"
+            print(f"{size:>8} {name:>12} {inserts:>9.4f} {lookups:>9.4f} {rank:>9} {deletes:>9.4f}")
+
+
+if __name__ == "__main__":
+    main()
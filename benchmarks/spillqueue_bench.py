@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Spill Queue Benchmark - enqueue/dequeue throughput while spilling to disk
+"""
+
+# Author Name: Prathamesh Pawar
+# Email: prathameshpawar1301@gmail.com
+
+import tempfile
+import time
+
+from Pqueue import Queue
+from Pspillqueue import SpillQueue
+
+ITEMS = 500000
+MEMORY_ITEMS = [ITEMS, 10000, 1000]
+PAYLOAD = {'id': 0, 'body': 'x' * 64}
+
+
+def fill_then_drain(queue, items=ITEMS):
+    """Return (enqueue items/sec, dequeue items/sec)"""
+    start = time.perf_counter()
+    for i in range(items):
+        queue.enqueue(PAYLOAD)
+    middle = time.perf_counter()
+    while not queue.isEmpty():
+        queue.dequeue()
+    end = time.perf_counter()
+    return items / (middle - start), items / (end - middle)
+
+
+def main():
+    print(f"=== Spill Queue Benchmark ({ITEMS} items, items/sec) ===")
+    print(f"{'queue':>24} {'enqueue':>10} {'dequeue':>10}")
+    enq, deq = fill_then_drain(Queue())
+    print(f"{'Queue (memory)':>24} {enq:>10.0f} {deq:>10.0f}")
+    for memory_items in MEMORY_ITEMS:
+        with tempfile.TemporaryDirectory() as directory:
+            queue = SpillQueue(directory, memory_items=memory_items)
+            enq, deq = fill_then_drain(queue)
+            queue.close()
+        print(f"{'SpillQueue mem=' + str(memory_items):>24} {enq:>10.0f} {deq:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
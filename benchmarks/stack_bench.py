@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Stack Benchmark - boxed list stack vs typed array stack
+"""
+
+# Author Name: Prathamesh Pawar
+# Email: prathameshpawar1301@gmail.com
+
+import time
+import tracemalloc
+
+from Pstack import Pstack
+
+SIZE = 10 ** 6
+MODES = [("list", None), ("array 'q'", 'q'), ("array 'i'", 'i'), ("array 'd'", 'd')]
+
+
+def bytes_per_item(typecode, size=SIZE):
+    """Bytes per pushed int; values are large enough that none are cached small ints"""
+    values = range(10 ** 6, 10 ** 6 + size)
+    tracemalloc.start()
+    stack = Pstack(typecode)
+    for value in values:
+        stack.push(value)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current / size
+
+
+def push_pop_ns(typecode, size=SIZE):
+    stack = Pstack(typecode)
+    start = time.perf_counter()
+    for value in range(size):
+        stack.push(value)
+    for _ in range(size):
+        stack.pop()
+    return (time.perf_counter() - start) * 1e9 / (2 * size)
+
+
+def main():
+    print(f"=== Stack Benchmark ({SIZE} ints) ===")
+    print(f"{'mode':>10} {'B/item':>8} {'push/pop ns':>12}")
+    for name, typecode in MODES:
+        print(f"{name:>10} {bytes_per_item(typecode):>8.1f} {push_pop_ns(typecode):>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Unrolled List Benchmark - middle inserts, indexing and iteration vs SLL and list
+"""
+
+# Author Name: Prathamesh Pawar
+# Email: prathameshpawar1301@gmail.com
+
+import random
+import time
+
+from Pnode import SNode
+from Psll import SLL
+from Punrolled import UnrolledLL
+
+SIZES = [10 ** 5, 4 * 10 ** 5]
+INSERTS = 2000
+LOOKUPS = 2000
+
+
+def sll_insert(sll, index, item):
+    """SLL has no positional insert; walk and link a node the way a caller would"""
+    if index == 0:
+        sll.addFront(item)
+        return
+    current = sll.head
+    for _ in range(index - 1):
+        current = current.next
+    node = SNode(item)
+    node.next = current.next
+    current.next = node
+    sll._size += 1
+
+
+def timed(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def run(size, rng):
+    positions = [rng.randrange(size // 4, 3 * size // 4) for _ in range(INSERTS)]
+    lookups = [rng.randrange(size) for _ in range(LOOKUPS)]
+
+    plain = list(range(size))
+    sll = SLL()
+    for i in reversed(range(size)):
+        sll.addFront(i)
+    unrolled = UnrolledLL(range(size))
+
+    results = {}
+    results['list'] = (
+        timed(lambda: [plain.insert(p, 0) for p in positions]),
+        timed(lambda: [plain[i] for i in lookups]),
+        timed(lambda: sum(1 for _ in plain)),
+    )
+    results['SLL'] = (
+        timed(lambda: [sll_insert(sll, p, 0) for p in positions]),
+        None,
+        timed(lambda: sum(1 for _ in sll)),
+    )
+    results['UnrolledLL'] = (
+        timed(lambda: [unrolled.insert(p, 0) for p in positions]),
+        timed(lambda: [unrolled[i] for i in lookups]),
+        timed(lambda: sum(1 for _ in unrolled)),
+    )
+    return results
+
+
+def main():
+    rng = random.Random(7)
+    print(f"=== Unrolled List Benchmark ({INSERTS} middle inserts, {LOOKUPS} lookups, seconds) ===")
+    print(f"{'size':>8} {'structure':>11} {'inserts':>9} {'lookups':>9} {'iterate':>9}")
+    for size in SIZES:
+        for name, (inserts, lookups, iterate) in run(size, rng).items():
+            lookup = "n/a" if lookups is None else f"{lookups:.4f}"
+            print(f"{size:>8} {name:>11} {inserts:>9.4f} {lookup:>9} {iterate:>9.4f}")
+
+
+if __name__ == "__main__":
+    main()
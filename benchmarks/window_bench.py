@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Window Benchmark - rolling min/max/sum by rescanning a window list vs the Pwindow aggregators
+"""
+
+# Author Name: Prathamesh Pawar
+# Email: prathameshpawar1301@gmail.com
+
+import random
+import time
+
+from Pwindow import MinMaxWindow, MonoidWindow, SumWindow
+
+WINDOWS = [10, 100, 1000]
+SAMPLES = 20000
+
+
+def timed(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def rescan(values, size):
+    window = []
+    for value in values:
+        window.append(value)
+        if len(window) > size:
+            del window[0]
+        min(window), max(window), sum(window)
+
+
+def incremental(values, size):
+    extremes = MinMaxWindow(size=size)
+    total = SumWindow(size=size)
+    for value in values:
+        extremes.push(value)
+        total.push(value)
+        extremes.min(), extremes.max(), total.sum()
+
+
+def monoid(values, size):
+    window = MonoidWindow(max, float('-inf'), size=size)
+    for value in values:
+        window.push(value)
+        window.query()
+
+
+def batched(values, size):
+    extremes = MinMaxWindow(size=size)
+    total = SumWindow(size=size)
+    for start in range(0, len(values), size):
+        extremes.update_many(values[start:start + size])
+        total.update_many(values[start:start + size])
+
+
+def main():
+    rng = random.Random(7)
+    values = [rng.random() for _ in range(SAMPLES)]
+    print(f"=== Window Benchmark ({SAMPLES} samples, seconds) ===")
+    print(f"{'window':>8} {'rescan':>9} {'min/max+sum':>12} {'monoid max':>11} {'update_many':>12}")
+    for size in WINDOWS:
+        print(f"{size:>8} {timed(lambda: rescan(values, size)):>9.4f} "
+              f"{timed(lambda: incremental(values, size)):>12.4f} "
+              f"{timed(lambda: monoid(values, size)):>11.4f} "
+              f"{timed(lambda: batched(values, size)):>12.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Work Stealing Benchmark - recursive divide-and-conquer on WorkStealingPool vs one shared BlockingQueue
+"""
+
+# Author Name: Prathamesh Pawar
+# Email: prathameshpawar1301@gmail.com
+
+import threading
+import time
+
+from Pblockingqueue import BlockingQueue
+from Pworksteal import WorkStealingPool
+
+WORKERS = [1, 2, 4, 8]
+SIZE = 2 * 10 ** 5
+LEAF = 32
+
+
+class SharedQueuePool:
+    """Baseline: every worker takes tasks from one shared BlockingQueue"""
+
+    def __init__(self, workers):
+        self._queue = BlockingQueue()
+        self._threads = [threading.Thread(target=self._worker, daemon=True) for _ in range(workers)]
+        for thread in self._threads:
+            thread.start()
+
+    def _worker(self):
+        while True:
+            task = self._queue.get()
+            if task is None:
+                return
+            fn, args = task
+            fn(*args)
+
+    def submit(self, fn, *args):
+        self._queue.put((fn, args))
+
+    def shutdown(self):
+        for _ in self._threads:
+            self._queue.put(None)
+        for thread in self._threads:
+            thread.join()
+
+
+def leaf_count(lo, hi):
+    if hi - lo <= LEAF:
+        return 1
+    mid = (lo + hi) // 2
+    return leaf_count(lo, mid) + leaf_count(mid, hi)
+
+
+def fork_sum(pool, lo, hi, leaves, expected, finished):
+    """Fork-only split: each half is a new task and leaves record their partial sums.
+    A shared FIFO queue cannot run fork-join code whose joins help with other
+    tasks: it hands out the oldest, largest tasks first, so the recursion depth explodes"""
+    if hi - lo <= LEAF:
+        leaves.append(sum(range(lo, hi)))
+        if len(leaves) == expected:
+            finished.set()
+        return
+    mid = (lo + hi) // 2
+    pool.submit(fork_sum, pool, lo, mid, leaves, expected, finished)
+    pool.submit(fork_sum, pool, mid, hi, leaves, expected, finished)
+
+
+def join_sum(pool, lo, hi):
+    """Fork-join split: the right half runs as a subtask that the left side joins"""
+    if hi - lo <= LEAF:
+        return sum(range(lo, hi))
+    mid = (lo + hi) // 2
+    right = pool.submit(join_sum, pool, mid, hi)
+    return join_sum(pool, lo, mid) + pool.join(right)
+
+
+def timed_fork(pool):
+    leaves, finished = [], threading.Event()
+    start = time.perf_counter()
+    pool.submit(fork_sum, pool, 0, SIZE, leaves, leaf_count(0, SIZE), finished)
+    finished.wait()
+    elapsed = time.perf_counter() - start
+    assert sum(leaves) == sum(range(SIZE))
+    return elapsed
+
+
+def timed_join(pool):
+    start = time.perf_counter()
+    result = pool.join(pool.submit(join_sum, pool, 0, SIZE))
+    elapsed = time.perf_counter() - start
+    assert result == sum(range(SIZE))
+    return elapsed
+
+
+def main():
+    print(f"=== Work Stealing Benchmark (sum of {SIZE} split to {LEAF}-wide leaves, seconds) ===")
+    print(f"{'workers':>8} {'shared fork':>12} {'stealing fork':>14} {'stealing join':>14} {'steals':>8}")
+    for workers in WORKERS:
+        shared = SharedQueuePool(workers)
+        shared_fork = timed_fork(shared)
+        shared.shutdown()
+
+        stealing = WorkStealingPool(workers)
+        stealing_fork = timed_fork(stealing)
+        stealing_join = timed_join(stealing)
+        steals = stealing.stats()['steals']
+        stealing.shutdown()
+        print(f"{workers:>8} {shared_fork:>12.4f} {stealing_fork:>14.4f} {stealing_join:>14.4f} {steals:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Spill Queue Examples - spilling to disk and resuming after a crash
+"""
+
+# Author Name: Prathamesh Pawar
+# Email: prathameshpawar1301@gmail.com
+
+import os
+import tempfile
+
+from Pspillqueue import SpillQueue
+
+
+def demonstrate_spill():
+    """Items beyond the in-memory bound go to segment files and come back in order"""
+    print("=== Spill Queue Demo ===")
+    with tempfile.TemporaryDirectory() as directory:
+        queue = SpillQueue(directory, memory_items=4)
+        for i in range(20):
+            queue.enqueue(i)
+        print(f"Enqueued 20 items with memory_items=4, size: {queue.size()}")
+        print(f"Files on disk: {sorted(os.listdir(directory))}")
+        drained = []
+        while not queue.isEmpty():
+            drained.append(queue.dequeue())
+        assert drained == list(range(20)), drained
+        print(f"Dequeued in order: {drained}")
+        queue.close()
+    print()
+
+
+def demonstrate_recovery():
+    """Spilled items survive a crash after every earlier segment was consumed"""
+    print("=== Spill Queue Crash Recovery ===")
+    with tempfile.TemporaryDirectory() as directory:
+        queue = SpillQueue(directory, memory_items=2, commit_every=1)
+        for i in range(10):
+            queue.enqueue(i)
+        while queue.dequeue() is not None:
+            pass
+        queue.close()
+
+        queue = SpillQueue(directory, memory_items=2, commit_every=1)
+        for i in range(100, 110):
+            queue.enqueue(i)
+        del queue   # crash: never closed, so only the spilled items are on disk
+
+        queue = SpillQueue(directory, memory_items=2, commit_every=1)
+        recovered = []
+        while not queue.isEmpty():
+            recovered.append(queue.dequeue())
+        assert recovered == list(range(102, 110)), recovered
+        print(f"Recovered after crash: {recovered}")
+        queue.close()
+    print()
+
+
+def main():
+    """Run all demonstrations"""
+    print("Spill Queue - Examples")
+    print("=" * 50)
+
+    demonstrate_spill()
+    demonstrate_recovery()
+
+    print("All demonstrations completed!")
+
+
+if __name__ == "__main__":
+    main()